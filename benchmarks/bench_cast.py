@@ -0,0 +1,80 @@
+"""Per-frame loop time while recording, including against a slow disk.
+
+Each frame steps the game, builds and encodes the frame, and hands it to
+the recorder, the way Game.run does, then sleeps out the rest of a short
+frame period so the writer thread gets the idle time a real loop leaves.
+The slow file sleeps on every write to stand in for disk pressure.
+
+    python benchmarks/bench_cast.py [frames] [period_ms]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from pypong import Ball, CPU, Court, Game
+from pypong.cast import CastRecorder
+from pypong.renderer import Renderer
+
+
+class SlowFile:
+    """Text file whose writes take delay seconds."""
+
+    def __init__(self, path, delay):
+        self._file = open(path, "w", encoding="utf-8")
+        self.delay = delay
+
+    def write(self, text):
+        time.sleep(self.delay)
+        return self._file.write(text)
+
+    def flush(self):
+        self._file.flush()
+
+
+def loop(cast, frames, period):
+    """Frame times in microseconds, sorted."""
+    game = Game()
+    game.add(CPU("left", difficulty="hard"), CPU("right", difficulty="hard"), Ball(), Court())
+    game.set_seed(1).set_win_score(10 ** 6)
+    renderer = Renderer()
+    clock = time.perf_counter
+    times = []
+    for _ in range(frames):
+        start = clock()
+        game.step()
+        frame = game._build_frame()
+        data = renderer.encode(frame)
+        if cast:
+            cast.frame(data, frame)
+        elapsed = clock() - start
+        times.append(elapsed * 1e6)
+        if period > elapsed:
+            time.sleep(period - elapsed)
+    if cast:
+        cast.close()
+    return sorted(times)
+
+
+def main(frames=1000, period_ms=5):
+    folder = tempfile.mkdtemp()
+    runs = [
+        ("no recording", lambda: None),
+        ("asciicast", lambda: CastRecorder(os.path.join(folder, "a.cast"))),
+        ("raw gzip", lambda: CastRecorder(os.path.join(folder, "a.raw"), format="raw")),
+        ("slow disk, drop", lambda: CastRecorder(SlowFile(os.path.join(folder, "s.cast"), 0.02))),
+        ("slow disk, block", lambda: CastRecorder(SlowFile(os.path.join(folder, "b.cast"), 0.02),
+                                                  policy="block", max_pending=16)),
+    ]
+    print(f"  {'run':<18} {'p50 us':>8} {'p99 us':>8} {'max us':>9} {'dropped':>8}")
+    for name, make in runs:
+        cast = make()
+        times = loop(cast, frames, period_ms / 1000)
+        dropped = cast.dropped if cast else 0
+        p50 = times[len(times) // 2]
+        p99 = times[int(len(times) * 0.99)]
+        print(f"  {name:<18} {p50:>8.1f} {p99:>8.1f} {times[-1]:>9.1f} {dropped:>8}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
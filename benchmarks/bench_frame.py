@@ -0,0 +1,48 @@
+"""Frame build time with and without the static frame template cache.
+
+Each mode runs several times, alternating, and the best run is kept.
+
+    python benchmarks/bench_frame.py [frames] [repeats]
+"""
+import sys
+import time
+
+from pypong import Ball, CPU, Court, Game, Paddle
+
+
+def build(width, height):
+    game = Game()
+    game.add(Paddle("left"), CPU("right", difficulty="hard"), Ball(), Court(width, height))
+    game.set_seed(1)
+    game.step()
+    return game
+
+
+def time_frames(game, frames, cached):
+    """Seconds per frame build, stepping the game between frames."""
+    template = game._template
+    clock = time.perf_counter
+    total = 0.0
+    for _ in range(frames):
+        game.step()
+        if not cached:
+            template.invalidate()
+        start = clock()
+        game._build_frame()
+        total += clock() - start
+    return total / frames
+
+
+def main(frames=2000, repeats=7):
+    print(f"  {'court':>9}  {'rebuilt us':>10}  {'cached us':>9}  {'saved':>6}")
+    for width, height in ((60, 22), (160, 50), (400, 120)):
+        rebuilt = cached = float("inf")
+        for _ in range(repeats):
+            rebuilt = min(rebuilt, time_frames(build(width, height), frames, cached=False))
+            cached = min(cached, time_frames(build(width, height), frames, cached=True))
+        saved = 1 - cached / rebuilt
+        print(f"  {width:>4}x{height:<4}  {rebuilt * 1e6:>10.1f}  {cached * 1e6:>9.1f}  {saved:>6.0%}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,55 @@
+"""Import time of pypong, measured with ``python -X importtime``.
+
+Each statement runs in a fresh interpreter; the best of several runs is
+reported, with the slowest pypong submodules it pulled in.
+
+    python benchmarks/bench_import.py [runs]
+"""
+import subprocess
+import sys
+
+STATEMENTS = (
+    "import pypong",
+    "from pypong import Game",
+    "from pypong import demo",
+)
+
+
+def import_times(statement):
+    """Return (total, modules) for one run of statement.
+
+    total is the cumulative time of the pypong imports at the top level,
+    in microseconds, and modules maps each pypong module to its own
+    cumulative time.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            capture_output=True, text=True, check=True)
+    total = 0
+    modules = {}
+    for line in result.stderr.splitlines():
+        parts = line[len("import time:"):].split("|")
+        if not line.startswith("import time:") or not parts[1].strip().isdigit():
+            continue
+        cumulative = int(parts[1])
+        name = parts[2][1:].rstrip()
+        module = name.lstrip()
+        if module.split(".")[0] != "pypong":
+            continue
+        modules[module] = cumulative
+        if module == name:
+            total += cumulative
+    return total, modules
+
+
+def main(runs=5):
+    for statement in STATEMENTS:
+        total, modules = min((import_times(statement) for _ in range(runs)),
+                             key=lambda run: run[0])
+        print(f"  {statement:<26} {total / 1000:7.2f} ms")
+        slowest = sorted(modules.items(), key=lambda item: -item[1])
+        for module, us in slowest[:4]:
+            print(f"      {module:<22} {us / 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
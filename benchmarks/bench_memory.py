@@ -0,0 +1,50 @@
+"""Bytes per headless match held in memory.
+
+    python benchmarks/bench_memory.py [matches]
+"""
+import sys
+import tracemalloc
+
+from pypong import Ball, CPU, Game, Paddle
+
+
+def build(count):
+    """Build and set up count CPU-vs-human matches."""
+    games = []
+    for _ in range(count):
+        game = Game()
+        game.add(Paddle("left"), CPU("right", difficulty="medium"), Ball())
+        game.set_headless()
+        game._setup()
+        games.append(game)
+    return games
+
+
+def shallow_size(obj):
+    """Object size plus its instance dict, if it has one."""
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def main(count=10000):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    games = build(count)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    game = games[0]
+    paddle_bytes = sum(shallow_size(p) for p in game.paddles)
+    collision_bytes = shallow_size(game.collision)
+
+    print(f"  matches            {count}")
+    print(f"  bytes per match    {total / count:,.0f}")
+    print(f"  paddles            {paddle_bytes:,} bytes (shallow, both)")
+    print(f"  collision handler  {collision_bytes:,} bytes (shallow)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
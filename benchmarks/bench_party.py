@@ -0,0 +1,44 @@
+"""Ticks per second for a multi-ball doubles match on a large court.
+
+    python benchmarks/bench_party.py [balls] [ticks]
+"""
+import sys
+import time
+
+from pypong import Ball, CPU, Court, Game
+
+
+def build(balls, width=400, height=120):
+    """Two CPUs per side and the given number of balls."""
+    game = Game()
+    game.add(Court(width, height))
+    game.add(CPU("left", difficulty="hard"), CPU("left", difficulty="medium", depth=width // 4))
+    game.add(CPU("right", difficulty="hard"), CPU("right", difficulty="medium", depth=width // 4))
+    for _ in range(balls):
+        game.add(Ball())
+    game.set_seed(1).set_win_score(10 ** 6)
+    game.step()
+    return game
+
+
+def main(balls=48, ticks=3000):
+    game = build(balls)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        game.step()
+    update = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(ticks // 10):
+        game._build_frame()
+    build_time = time.perf_counter() - start
+
+    budget = 1.0 / game.tick_rate
+    print(f"  balls              {balls}")
+    print(f"  ticks per second   {ticks / update:,.0f} (need {budget:,.0f})")
+    print(f"  frame build        {build_time / (ticks // 10) * 1000:.3f} ms")
+    print(f"  scores             {game.scores}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
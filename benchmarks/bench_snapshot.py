@@ -0,0 +1,47 @@
+"""Compare pypong snapshots with pickle for size and speed.
+
+    python benchmarks/bench_snapshot.py
+"""
+import pickle
+import timeit
+
+from pypong import Ball, CPU, Game, Paddle
+
+
+def build():
+    game = Game()
+    game.add(Paddle("left"), CPU("right", difficulty="medium"), Ball())
+    for _ in range(200):
+        game.step()
+    return game
+
+
+def main(number=20000):
+    game = build()
+    state = (game.ball, game.paddles, game.collision, game.scores,
+             game.countdown, game.countdown_ticks, game.ticks)
+
+    data = game.snapshot()
+    data_no_rng = game.snapshot(rng=False)
+    pickled = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+
+    rows = [
+        ("snapshot", len(data),
+         timeit.timeit(game.snapshot, number=number),
+         timeit.timeit(lambda: game.restore(data), number=number)),
+        ("snapshot (no rng)", len(data_no_rng),
+         timeit.timeit(lambda: game.snapshot(rng=False), number=number),
+         timeit.timeit(lambda: game.restore(data_no_rng), number=number)),
+        ("pickle", len(pickled),
+         timeit.timeit(lambda: pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL),
+                       number=number),
+         timeit.timeit(lambda: pickle.loads(pickled), number=number)),
+    ]
+
+    print(f"  {'format':<20}{'bytes':>8}{'dump us':>10}{'load us':>10}")
+    for name, size, dump, load in rows:
+        print(f"  {name:<20}{size:>8}{dump / number * 1e6:>10.2f}{load / number * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
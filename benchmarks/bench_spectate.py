@@ -0,0 +1,67 @@
+"""Tick time with a spectator hub as the number of viewers grows.
+
+With no viewers the hub skips the frame entirely. Every viewer is a pipe drained between ticks, outside the timed region.
+
+    python benchmarks/bench_spectate.py [ticks]
+"""
+import os
+import sys
+import time
+
+from pypong import Ball, CPU, Court, Game
+from pypong.spectate import SpectatorHub
+
+
+def build(hub):
+    game = Game()
+    game.add(CPU("left", difficulty="hard"), CPU("right", difficulty="hard"), Ball(), Court())
+    game.set_seed(1).set_win_score(10 ** 6).set_spectators(hub)
+    return game
+
+
+def time_ticks(viewers, ticks):
+    """Average seconds per tick with the given number of viewers."""
+    hub = SpectatorHub()
+    readers = []
+    for _ in range(viewers):
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        hub.add(write_fd)
+        readers.append(read_fd)
+    game = build(hub)
+
+    clock = time.perf_counter
+    total = 0.0
+    for _ in range(ticks):
+        start = clock()
+        game.step()
+        total += clock() - start
+        for fd in readers:
+            try:
+                os.read(fd, 1 << 20)
+            except BlockingIOError:
+                pass
+
+    hub.close()
+    for fd in readers:
+        os.close(fd)
+    return total / ticks
+
+
+def main(ticks=2000):
+    # One viewer pays for building and encoding the frame; each extra
+    # viewer should only add a write
+    print(f"  {'viewers':>7}  {'us/tick':>8}  {'us per extra viewer':>19}")
+    one = None
+    for viewers in (0, 1, 10, 50, 200):
+        per_tick = time_ticks(viewers, ticks)
+        extra = ""
+        if viewers == 1:
+            one = per_tick
+        elif viewers > 1:
+            extra = f"{(per_tick - one) / (viewers - 1) * 1e6:.2f}"
+        print(f"  {viewers:>7}  {per_tick * 1e6:>8.1f}  {extra:>19}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
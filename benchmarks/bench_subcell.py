@@ -0,0 +1,42 @@
+"""Frame build time and bytes per frame for each render mode.
+
+    python benchmarks/bench_subcell.py [frames]
+"""
+import sys
+import time
+
+from pypong import Ball, CPU, Court, Game
+from pypong.renderer import Renderer
+
+
+def measure(mode, frames, width=120, height=40):
+    """(us per frame build, encoded bytes per frame) over a seeded match."""
+    game = Game()
+    game.add(CPU("left", difficulty="hard"), CPU("right", difficulty="hard"),
+             Ball(), Court(width, height))
+    game.set_seed(1).set_win_score(10 ** 6).set_render_mode(mode)
+    while game.step() and game.countdown:
+        pass
+
+    renderer = Renderer()
+    first = len(renderer.encode(game._build_frame()))
+    clock = time.perf_counter
+    build = 0.0
+    for _ in range(frames):
+        game.step()
+        start = clock()
+        frame = game._build_frame()
+        build += clock() - start
+        renderer.encode(frame)
+    return build / frames * 1e6, (renderer.total_bytes - first) / frames
+
+
+def main(frames=3000):
+    print(f"  {'mode':<8} {'build us':>9} {'bytes/frame':>12}")
+    for mode in ("cell", "half", "braille"):
+        build, size = measure(mode, frames)
+        print(f"  {mode:<8} {build:>9.1f} {size:>12.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 3000)
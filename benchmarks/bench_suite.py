@@ -0,0 +1,197 @@
+"""Engine hot path benchmarks across court sizes, ball speeds and paddle counts.
+
+Every scenario is a seeded CPU-vs-CPU match run headless. For each one
+the suite reports simulation ticks/sec, frame builds/sec and the peak
+bytes tracemalloc sees allocated per tick and per frame. Micro benchmarks
+time the individual hot paths (wall bounces, paddle checks, CPU.update,
+Paddle.get_cells).
+
+    python benchmarks/bench_suite.py --json results.json
+    python benchmarks/bench_suite.py --compare results.json --threshold 0.15
+
+With --compare the run exits with status 1 if any rate dropped, or any
+allocation figure grew, by more than the threshold fraction.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from pypong import Ball, CPU, Court, Game
+
+COURTS = ((60, 22), (120, 40), (200, 60), (400, 120))
+BALL_SPEEDS = (1.0, 2.0)
+PADDLE_COUNTS = (2, 4)
+
+# Metrics where a bigger number is better; the rest are costs
+RATES = ("ticks_per_sec", "frames_per_sec", "ops_per_sec")
+
+
+def build(width, height, ball_speed, paddles, seed=1):
+    """A seeded CPU match; four paddles add a second pair in midfield."""
+    game = Game()
+    game.add(Court(width, height))
+    game.add(CPU("left", difficulty="hard"), CPU("right", difficulty="hard"))
+    if paddles == 4:
+        depth = width // 4
+        game.add(CPU("left", difficulty="medium", depth=depth),
+                 CPU("right", difficulty="medium", depth=depth))
+    game.add(Ball(speed=ball_speed, max_speed=max(2.5, ball_speed)))
+    game.set_seed(seed).set_win_score(10 ** 6)
+    # Start timing with the ball in play, not during the countdown
+    while game.step() and game.countdown:
+        pass
+    return game
+
+
+def best_rate(func, count, repeats):
+    """Best calls per second of func over several timed batches."""
+    best = 0.0
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(count):
+            func()
+        elapsed = time.perf_counter() - start
+        best = max(best, count / elapsed)
+    return best
+
+
+def peak_bytes(func, count):
+    """Average peak bytes allocated by one call of func."""
+    tracemalloc.start()
+    total = 0
+    for _ in range(count):
+        # Clearing the traces also resets the peak
+        tracemalloc.clear_traces()
+        func()
+        total += tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return total / count
+
+
+def run_scenario(width, height, ball_speed, paddles, ticks, frames, repeats):
+    game = build(width, height, ball_speed, paddles)
+    tick_rate = best_rate(game.step, ticks, repeats)
+    frame_rate = best_rate(game._build_frame, frames, repeats)
+    return {
+        "ticks_per_sec": tick_rate,
+        "frames_per_sec": frame_rate,
+        "tick_peak_bytes": peak_bytes(game.step, frames),
+        "frame_peak_bytes": peak_bytes(game._build_frame, frames),
+    }
+
+
+def run_micro(count, repeats):
+    """Time each engine hot path on its own at the default court size."""
+    game = build(60, 22, 1.0, 2)
+    ball = game.ball
+    paddle = game.paddles[0]
+    cpu = game.paddles[1]
+    collision = game.collision
+
+    def bounce_walls():
+        ball.y = collision.court_top - 0.25
+        collision.bounce_walls(ball)
+
+    def check_paddle():
+        ball.x, ball.y, ball.dx = paddle.x + 1.0, paddle.y + 2.0, -1.0
+        collision.check_paddle(ball, paddle)
+
+    def cpu_update():
+        ball.dx = 1.0
+        cpu.update(ball)
+
+    paths = {
+        "bounce_walls": bounce_walls,
+        "check_paddle": check_paddle,
+        "cpu_update": cpu_update,
+        "get_cells": paddle.get_cells,
+        "update": game._update,
+        "build_frame": game._build_frame,
+    }
+    return {name: {"ops_per_sec": best_rate(func, count, repeats)}
+            for name, func in paths.items()}
+
+
+def run(quick=False):
+    ticks, frames, repeats, count = (500, 100, 2, 5000) if quick else (3000, 500, 3, 50000)
+    results = {}
+    for width, height in COURTS:
+        for ball_speed in BALL_SPEEDS:
+            for paddles in PADDLE_COUNTS:
+                name = f"{width}x{height}/speed{ball_speed:g}/paddles{paddles}"
+                results[name] = run_scenario(width, height, ball_speed, paddles,
+                                             ticks, frames, repeats)
+    for name, metrics in run_micro(count, repeats).items():
+        results[f"micro/{name}"] = metrics
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "quick": quick,
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold):
+    """Return a line for every metric that regressed past threshold."""
+    regressions = []
+    for name, metrics in current["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+        for metric, value in metrics.items():
+            before = old.get(metric)
+            if not before:
+                continue
+            if metric in RATES:
+                change = (before - value) / before
+            else:
+                change = (value - before) / before
+            if change > threshold:
+                regressions.append(f"{name} {metric}: {before:,.1f} -> {value:,.1f} "
+                                   f"({change:.0%} worse)")
+    return regressions
+
+
+def print_table(data):
+    print(f"  {'scenario':<34} {'ticks/s':>10} {'frames/s':>10} {'tick B':>8} {'frame B':>8}")
+    for name, m in data["results"].items():
+        if "ops_per_sec" in m:
+            print(f"  {name:<34} {m['ops_per_sec']:>10,.0f} ops/s")
+        else:
+            print(f"  {name:<34} {m['ticks_per_sec']:>10,.0f} {m['frames_per_sec']:>10,.0f} "
+                  f"{m['tick_peak_bytes']:>8,.0f} {m['frame_peak_bytes']:>8,.0f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the pypong engine hot paths.")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--compare", help="baseline results file to check against")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="allowed fractional regression (default 0.15)")
+    parser.add_argument("--quick", action="store_true", help="shorter runs")
+    args = parser.parse_args(argv)
+
+    data = run(args.quick)
+    print_table(data)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(data, baseline, args.threshold)
+        for line in regressions:
+            print(f"  REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"  no regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
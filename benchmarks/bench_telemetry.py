@@ -0,0 +1,53 @@
+"""Game loop cost of telemetry: ticks/sec with and without it.
+
+    python benchmarks/bench_telemetry.py [matches]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from pypong import Ball, CPU, Court, Game
+from pypong.telemetry import Telemetry
+
+
+def play(matches, telemetry):
+    """Play seeded CPU matches back to back. Returns (ticks, seconds)."""
+    ticks = 0
+    start = time.perf_counter()
+    for seed in range(matches):
+        game = Game()
+        game.add(CPU("left", difficulty="hard"), CPU("right", difficulty="medium"),
+                 Ball(), Court())
+        game.set_seed(seed).set_win_score(5).set_telemetry(telemetry)
+        while game.step() and not game.game_over:
+            pass
+        ticks += game.ticks
+    return ticks, time.perf_counter() - start
+
+
+def main(matches=200):
+    ticks, plain = play(matches, None)
+    print(f"  no telemetry       {ticks / plain:>10,.0f} ticks/s")
+
+    memory = Telemetry()
+    _, elapsed = play(matches, memory)
+    print(f"  aggregates only    {ticks / elapsed:>10,.0f} ticks/s")
+
+    for columnar in (True, False):
+        path = os.path.join(tempfile.mkdtemp(), "events")
+        telemetry = Telemetry(path, columnar=columnar)
+        _, elapsed = play(matches, telemetry)
+        telemetry.close()
+        label = "columnar file" if columnar else "ndjson file"
+        print(f"  {label:<18} {ticks / elapsed:>10,.0f} ticks/s"
+              f"  ({os.path.getsize(path):,} bytes, {telemetry.dropped_batches} dropped)")
+
+    summary = memory.summary()
+    print(f"  events             {summary['counts']}")
+    print(f"  longest rally      {summary['longest_rally']}")
+    print(f"  avg score speed    {summary['avg_score_speed']:.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
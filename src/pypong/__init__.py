@@ -0,0 +1,38 @@
+# Public names and the submodule that defines each. Submodules load on
+# first access, so ``import pypong`` stays cheap for headless users.
+_EXPORTS = {
+    "Ball": "ball",
+    "Paddle": "paddle",
+    "Court": "court",
+    "CPU": "cpu",
+    "Game": "game",
+}
+
+__all__ = list(_EXPORTS) + ["demo"]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(__import__(module, globals(), None, [name], 1), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+def demo():
+    """Run a quick demo game."""
+    from .ball import Ball
+    from .court import Court
+    from .game import Game
+    from .paddle import Paddle
+
+    game = Game()
+    game.add(Paddle("left"), Paddle("right"), Ball(), Court())
+    game.set_win_score(5)
+    game.run()
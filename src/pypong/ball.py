@@ -1,90 +1,85 @@
-class CollisionHandler:
-    """Handles all ball collision detection and response."""
+import random
 
-    def __init__(self, court_top=1.0, court_bottom=None, min_dy=0.3, max_dy=0.9):
-        self.court_top = court_top
-        self.court_bottom = court_bottom
-        self.min_dy = min_dy
-        self.max_dy = max_dy
 
-    def set_bounds(self, height):
-        """Set court boundaries based on court height."""
-        self.court_bottom = float(height - 2)
+class Ball:
+    """The ball. Moves in whole velocity steps, ``speed`` steps per tick."""
 
-    def bounce_walls(self, ball):
-        """Handle ball bouncing off top and bottom walls. Returns True if bounced."""
-        bounced = False
-        bounce_count = 0
+    __slots__ = ("char", "base_speed", "speed", "max_speed", "speed_increment",
+                 "serve_dy", "trail_enabled", "x", "y", "dx", "dy", "frozen",
+                 "court_width", "court_height", "rng", "_accum")
 
-        while (ball.y < self.court_top or ball.y > self.court_bottom) and bounce_count < 10:
-            bounce_count += 1
-            bounced = True
-            if ball.y < self.court_top:
-                ball.y = 2 * self.court_top - ball.y
-                ball.dy = abs(ball.dy)
-                if abs(ball.dy) < self.min_dy:
-                    ball.dy = self.min_dy
-            if ball.y > self.court_bottom:
-                ball.y = 2 * self.court_bottom - ball.y
-                ball.dy = -abs(ball.dy)
-                if abs(ball.dy) < self.min_dy:
-                    ball.dy = -self.min_dy
+    def __init__(self, char="●", speed=1.0, max_speed=2.5, speed_increment=0.08,
+                 serve_dy=0.5, trail=True, seed=None):
+        self.char = char
+        self.base_speed = speed
+        self.speed = speed
+        self.max_speed = max_speed
+        self.speed_increment = speed_increment
+        # Serves leave at a random dy in [-serve_dy, serve_dy]
+        self.serve_dy = serve_dy
+        self.trail_enabled = trail
 
-        # Hard clamp safety
-        if ball.y <= self.court_top:
-            ball.y = self.court_top + 0.5
-            ball.dy = abs(ball.dy)
-            if abs(ball.dy) < self.min_dy:
-                ball.dy = self.min_dy
-        if ball.y >= self.court_bottom:
-            ball.y = self.court_bottom - 0.5
-            ball.dy = -abs(ball.dy)
-            if abs(ball.dy) < self.min_dy:
-                ball.dy = -self.min_dy
+        self.x = 0.0
+        self.y = 0.0
+        self.dx = 0.0
+        self.dy = 0.0
+        self.frozen = False
 
-        return bounced
+        self.court_width = 0
+        self.court_height = 0
+        # Serve generator; Game swaps in its own so a seed covers every ball
+        self.rng = random.Random(seed)
+        # Fraction of a step carried over to the next tick
+        self._accum = 0.0
 
-    def check_paddle(self, ball, paddle):
-        """Check if ball hits a paddle. Returns True if hit."""
-        by = int(round(ball.y))
-        by = max(1, by)
-        paddle_top = int(paddle.y)
-        paddle_bottom = paddle_top + paddle.height
+    def setup(self, court_width, court_height):
+        """Initialize ball for given court size and serve it."""
+        self.court_width = court_width
+        self.court_height = court_height
+        self.reset()
 
-        if paddle.side == "left":
-            if ball.x <= paddle.x + 1 and ball.dx < 0:
-                if paddle_top <= by < paddle_bottom:
-                    ball.x = float(paddle.x + 2)
-                    ball.dx = abs(ball.dx)
-                    self._apply_spin(ball, paddle)
-                    return True
-                elif ball.x < 0:
-                    return "scored"
+    def reset(self, direction=None):
+        """Serve from the centre, towards direction (-1 left, 1 right) or at random."""
+        self.x = float(self.court_width // 2)
+        self.y = float(self.court_height // 2)
+        self.speed = self.base_speed
+        if direction is None:
+            direction = self.rng.choice([-1, 1])
+        self.dx = float(direction)
+        self.dy = self.rng.uniform(-self.serve_dy, self.serve_dy)
+        self._accum = 0.0
 
-        elif paddle.side == "right":
-            if ball.x >= paddle.x - 1 and ball.dx > 0:
-                if paddle_top <= by < paddle_bottom:
-                    ball.x = float(paddle.x - 2)
-                    ball.dx = -abs(ball.dx)
-                    self._apply_spin(ball, paddle)
-                    return True
-                elif ball.x >= paddle.court_width:
-                    return "scored"
+    def update(self, dt):
+        """Move the ball for one tick, yielding its position after each step.
 
-        return False
+        Speed is in steps per tick, so dt is not used; a fractional speed
+        carries its remainder over to the next tick.
+        """
+        if self.frozen:
+            return
+        self._accum += self.speed
+        while self._accum >= 1.0:
+            self._accum -= 1.0
+            self.x += self.dx
+            self.y += self.dy
+            yield self.x, self.y
 
-    def _apply_spin(self, ball, paddle):
-        """Apply spin to ball based on where it hits the paddle."""
-        by = int(round(ball.y))
-        center = paddle.y + paddle.height / 2.0
-        offset = (by - center) / (paddle.height / 2.0)
-        ball.dy = offset * 1.0
+    def advance(self, dt):
+        """Move the ball for one tick in a single step. Returns the steps taken.
 
-        if abs(ball.dy) < self.min_dy:
-            ball.dy = self.min_dy if ball.dy >= 0 else -self.min_dy
-        if ball.dy > self.max_dy:
-            ball.dy = self.max_dy
-        elif ball.dy < -self.max_dy:
-            ball.dy = -self.max_dy
+        Ends where draining update() would, at a cost that does not grow
+        with speed; the swept collision path resolves the move afterwards.
+        """
+        if self.frozen:
+            return 0
+        self._accum += self.speed
+        steps = int(self._accum)
+        if steps:
+            self._accum -= steps
+            self.x += self.dx * steps
+            self.y += self.dy * steps
+        return steps
 
-        ball.speed = min(ball.speed + ball.speed_increment, ball.max_speed)
+    def get_display_pos(self):
+        """Get (x, y) cell for rendering."""
+        return int(round(self.x)), int(round(self.y))
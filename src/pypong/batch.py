@@ -0,0 +1,328 @@
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .court import Court
+from .collision import CollisionHandler
+
+
+class BatchEngine:
+    """Simulates many headless matches at once with NumPy arrays.
+
+    Each match follows the same rules as a headless ``Game`` with a left and
+    a right paddle and substep collisions (``CollisionHandler(swept=False)``):
+    the ball moves in unit substeps like ``Ball.update``, every substep runs
+    the ``bounce_walls`` and ``check_paddle`` rules, and scoring, serves and
+    the countdown follow ``Game._update``. Matches that finish stay frozen
+    until all are done.
+
+    Paddles are driven either by a ``CPU`` passed as ``left``/``right`` or
+    by the moves given to ``step``.
+    """
+
+    def __init__(self, n, court=None, left=None, right=None, paddle_height=5,
+                 paddle_speed=2, ball_speed=1.0, max_speed=2.5,
+                 speed_increment=0.08, serve_dy=0.5, win_score=7,
+                 tick_rate=0.045, collision=None, seed=None):
+        if np is None:
+            raise ImportError("BatchEngine requires numpy (pip install pypong[batch])")
+
+        court = court or Court()
+        collision = collision or CollisionHandler()
+        collision.set_bounds(court.height)
+
+        self.n = n
+        self.width = court.width
+        self.height = court.height
+        self.court_top = collision.court_top
+        self.court_bottom = collision.court_bottom
+        self.min_dy = collision.min_dy
+        self.max_dy = collision.max_dy
+
+        self.paddle_height = paddle_height
+        self.paddle_speed = paddle_speed
+        self.left_x = 1
+        self.right_x = court.width - 2
+        self.left_cpu = self._cpu_config(left)
+        self.right_cpu = self._cpu_config(right)
+
+        self.ball_speed = ball_speed
+        self.max_speed = max_speed
+        self.speed_increment = speed_increment
+        self.serve_dy = serve_dy
+        self.win_score = win_score
+
+        # Countdown length in ticks, as counted by Game._start_countdown
+        self.ticks_per_count = int(math.ceil(1.0 / tick_rate - 1e-9))
+        self.max_substeps = int(math.ceil(max_speed)) + 1
+
+        self.rng = np.random.default_rng(seed)
+        self.reset()
+
+    @staticmethod
+    def _cpu_config(cpu):
+        """Return the difficulty preset for a CPU, or None for manual control."""
+        if cpu is None:
+            return None
+        return cpu._configs.get(cpu.difficulty, cpu._configs["medium"])
+
+    def reset(self):
+        """Start every match from scratch."""
+        n = self.n
+        self.x = np.zeros(n)
+        self.y = np.zeros(n)
+        self.dx = np.zeros(n)
+        self.dy = np.zeros(n)
+        self.speed = np.zeros(n)
+        self.accum = np.zeros(n)
+
+        start_y = float(self.height // 2 - self.paddle_height // 2)
+        self.left_y = np.full(n, start_y)
+        self.right_y = np.full(n, start_y)
+
+        self.scores_left = np.zeros(n, dtype=np.int64)
+        self.scores_right = np.zeros(n, dtype=np.int64)
+        self.hits_left = np.zeros(n, dtype=np.int64)
+        self.hits_right = np.zeros(n, dtype=np.int64)
+        self.wall_bounces = np.zeros(n, dtype=np.int64)
+        self.game_over = np.zeros(n, dtype=bool)
+        self.ticks = 0
+        self.end_tick = np.full(n, -1, dtype=np.int64)
+        self._timer_left = np.zeros(n, dtype=np.int64)
+        self._timer_right = np.zeros(n, dtype=np.int64)
+        self.countdown = np.zeros(n, dtype=np.int64)
+
+        everyone = np.ones(n, dtype=bool)
+        direction = self.rng.choice([-1.0, 1.0], size=n)
+        self._serve(everyone, direction)
+
+    def _serve(self, mask, direction):
+        """Put the ball back in the middle for the masked matches."""
+        count = int(mask.sum())
+        if count == 0:
+            return
+        self.x[mask] = float(self.width // 2)
+        self.y[mask] = float(self.height // 2)
+        self.speed[mask] = self.ball_speed
+        self.accum[mask] = 0.0
+        self.dx[mask] = direction[mask] if np.ndim(direction) else direction
+        self.dy[mask] = self.rng.uniform(-self.serve_dy, self.serve_dy, size=count)
+        self.countdown[mask] = 3 * self.ticks_per_count
+
+    def _move_paddles(self, paddle_y, moves):
+        """Apply key moves (-1 up, 0, +1 down) like Paddle.handle_input."""
+        if moves is None:
+            return
+        moves = np.asarray(moves)
+        live = ~self.game_over
+        limit = self.height - self.paddle_height
+        moved = np.clip(paddle_y + moves * self.paddle_speed, 0, limit)
+        paddle_y[live] = moved[live]
+
+    def _bounce_walls(self, mask):
+        """Vectorized CollisionHandler.bounce_walls for the masked matches."""
+        top = self.court_top
+        bottom = self.court_bottom
+        y = self.y
+        dy = self.dy
+        bounced = np.zeros(self.n, dtype=bool)
+
+        for _ in range(10):
+            out = mask & ((y < top) | (y > bottom))
+            if not out.any():
+                break
+            bounced |= out
+            low = out & (y < top)
+            y[low] = 2 * top - y[low]
+            dy[low] = np.maximum(np.abs(dy[low]), self.min_dy)
+            high = out & (y > bottom)
+            y[high] = 2 * bottom - y[high]
+            dy[high] = -np.maximum(np.abs(dy[high]), self.min_dy)
+
+        # Hard clamp safety
+        low = mask & (y <= top)
+        y[low] = top + 0.5
+        dy[low] = np.maximum(np.abs(dy[low]), self.min_dy)
+        high = mask & (y >= bottom)
+        y[high] = bottom - 0.5
+        dy[high] = -np.maximum(np.abs(dy[high]), self.min_dy)
+
+        self.wall_bounces += bounced
+
+    def _check_paddle(self, mask, side):
+        """Vectorized CollisionHandler.check_paddle. Returns (hit, scored)."""
+        by = np.maximum(np.round(self.y), 1)
+        previous = self.x - self.dx
+        if side == "left":
+            paddle_x = self.left_x
+            paddle_y = self.left_y
+            face = paddle_x + 1
+            toward = mask & (self.dx < 0)
+            cross = toward & (self.x <= face) & (face < previous)
+        else:
+            paddle_x = self.right_x
+            paddle_y = self.right_y
+            face = paddle_x - 1
+            toward = mask & (self.dx > 0)
+            cross = toward & (previous < face) & (face <= self.x)
+
+        top = np.floor(paddle_y)
+        hit = cross & (top <= by) & (by < top + self.paddle_height)
+        if side == "left":
+            scored = toward & ~hit & (self.x < 0)
+            self.x[hit] = float(paddle_x + 2)
+            self.dx[hit] = np.abs(self.dx[hit])
+        else:
+            scored = toward & ~hit & (self.x >= self.width)
+            self.x[hit] = float(paddle_x - 2)
+            self.dx[hit] = -np.abs(self.dx[hit])
+
+        if hit.any():
+            self._apply_spin(hit, paddle_y)
+        return hit, scored
+
+    def _apply_spin(self, mask, paddle_y):
+        """Vectorized CollisionHandler._apply_spin."""
+        half = self.paddle_height / 2.0
+        by = np.round(self.y[mask])
+        center = paddle_y[mask] + half
+        dy = (by - center) / half
+
+        small = np.abs(dy) < self.min_dy
+        dy[small] = np.where(dy[small] >= 0, self.min_dy, -self.min_dy)
+        self.dy[mask] = np.clip(dy, -self.max_dy, self.max_dy)
+        self.speed[mask] = np.minimum(self.speed[mask] + self.speed_increment,
+                                      self.max_speed)
+
+    def _score(self, scored, scoring_left):
+        """Credit points, end finished matches and serve the rest."""
+        if scoring_left:
+            self.scores_left += scored
+            won = scored & (self.scores_left >= self.win_score)
+            direction = 1.0
+        else:
+            self.scores_right += scored
+            won = scored & (self.scores_right >= self.win_score)
+            direction = -1.0
+
+        self.game_over |= won
+        self.end_tick[won] = self.ticks
+        self._serve(scored & ~won, direction)
+
+    def _predict(self, mask, side):
+        """Vectorized CPU._predict: folded intercept y at the paddle face."""
+        x = self.x[mask]
+        dx = self.dx[mask]
+        if side == "left":
+            face_x = self.left_x + 1
+            incoming = dx < 0
+        else:
+            face_x = self.right_x - 1
+            incoming = dx > 0
+
+        steps = np.maximum((face_x - x) / dx, 0.0)
+        y = self.y[mask] + self.dy[mask] * steps
+        top = self.court_top
+        span = self.court_bottom - top
+        if span > 0:
+            offset = np.mod(y - top, 2 * span)
+            y = top + np.where(offset > span, 2 * span - offset, offset)
+        return np.where(incoming, y, self.height / 2.0)
+
+    def _update_cpu(self, mask, paddle_y, config, timer, side):
+        """Vectorized CPU.update for the masked matches."""
+        timer[mask] += 1
+        act = mask & (timer % config["react_every"] == 0)
+        count = int(act.sum())
+        if count == 0:
+            return
+
+        if config.get("predict"):
+            target = self._predict(act, side)
+        else:
+            target = self.y[act]
+        wobble = config["wobble"]
+        target = target + self.rng.uniform(-wobble, wobble, size=count)
+        diff = target - (paddle_y[act] + self.paddle_height / 2.0)
+
+        if config["chase_always"]:
+            chase = np.ones(count, dtype=bool)
+        elif side == "right":
+            chase = self.dx[act] > 0
+        else:
+            chase = self.dx[act] < 0
+
+        step = np.where(diff > 0, config["speed"], -config["speed"])
+        moved = np.clip(paddle_y[act] + step, 0, self.height - self.paddle_height)
+        paddle_y[act] = np.where(chase & (np.abs(diff) > 1), moved, paddle_y[act])
+
+    def step(self, left=None, right=None):
+        """Advance every match by one tick.
+
+        ``left``/``right`` are arrays of key moves (-1 up, 0, +1 down) for
+        paddles without a CPU.
+        """
+        self._move_paddles(self.left_y, left)
+        self._move_paddles(self.right_y, right)
+        self.ticks += 1
+
+        live = ~self.game_over
+        waiting = live & (self.countdown > 0)
+        self.countdown[waiting] -= 1
+        alive = live & ~waiting
+        playing = alive.copy()
+
+        # Ball substeps, like iterating Ball.update
+        self.accum[alive] += self.speed[alive]
+        for _ in range(self.max_substeps):
+            moving = alive & (self.accum >= 1.0)
+            if not moving.any():
+                break
+            self.accum[moving] -= 1.0
+            self.x[moving] += self.dx[moving]
+            self.y[moving] += self.dy[moving]
+
+            self._bounce_walls(moving)
+
+            hit, scored = self._check_paddle(moving, "left")
+            self.hits_left += hit
+            self._score(scored, scoring_left=False)
+            alive &= ~scored
+
+            moving &= ~scored
+            hit, scored = self._check_paddle(moving, "right")
+            self.hits_right += hit
+            self._score(scored, scoring_left=True)
+            alive &= ~scored
+
+        # CPUs only think on ticks where nobody scored
+        playing &= alive
+        if self.left_cpu is not None:
+            self._update_cpu(playing, self.left_y, self.left_cpu,
+                             self._timer_left, "left")
+        if self.right_cpu is not None:
+            self._update_cpu(playing, self.right_y, self.right_cpu,
+                             self._timer_right, "right")
+
+    def run(self, max_ticks=100000):
+        """Step until every match is over or max_ticks is reached."""
+        while self.ticks < max_ticks and not self.game_over.all():
+            self.step()
+        return self.results()
+
+    def results(self):
+        """Per-match scores, hits and winners as NumPy arrays."""
+        winner = np.where(self.scores_left > self.scores_right, "left", "right")
+        winner = np.where(self.game_over, winner, "")
+        return {
+            "scores_left": self.scores_left.copy(),
+            "scores_right": self.scores_right.copy(),
+            "hits_left": self.hits_left.copy(),
+            "hits_right": self.hits_right.copy(),
+            "wall_bounces": self.wall_bounces.copy(),
+            "winner": winner,
+            "end_tick": self.end_tick.copy(),
+        }
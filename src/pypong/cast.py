@@ -0,0 +1,158 @@
+import gzip
+import json
+import queue
+import struct
+import threading
+import time
+
+from .renderer import Renderer
+
+# Raw log: gzip stream of MAGIC, RAW_HEADER (width, height), then one
+# RAW_RECORD (seconds since start, length) plus frame bytes per frame.
+MAGIC = b"PPRAW1"
+RAW_HEADER = struct.Struct("<HH")
+RAW_RECORD = struct.Struct("<dI")
+
+FORMATS = ("asciicast", "raw")
+POLICIES = ("drop", "block")
+
+
+class CastRecorder:
+    """Records the frames a game sends to the terminal, off the game loop.
+
+    Each frame's bytes are timestamped and queued; a background thread
+    writes them as asciicast v2 (playable with ``asciinema play``) or as
+    a gzip-compressed raw log. If the writer falls ``max_pending`` frames
+    behind, the "drop" policy skips frames and records a full keyframe
+    once there is room again, so playback stays correct; "block" waits
+    instead and keeps every frame. Attach with ``Game.set_cast``.
+    """
+
+    def __init__(self, target, format="asciicast", policy="drop", max_pending=256,
+                 title=None):
+        if format not in FORMATS:
+            raise ValueError(f"unknown cast format {format!r}")
+        if policy not in POLICIES:
+            raise ValueError(f"unknown drop policy {policy!r}")
+        self.format = format
+        self.policy = policy
+        self.title = title
+
+        self._owns_file = isinstance(target, str)
+        if format == "raw":
+            if self._owns_file:
+                self._file = gzip.open(target, "wb")
+            else:
+                self._file = gzip.GzipFile(fileobj=target, mode="wb")
+            self._owns_file = True
+        elif self._owns_file:
+            self._file = open(target, "w", encoding="utf-8")
+        else:
+            self._file = target
+
+        self._renderer = Renderer()
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._start = None
+        self.needs_keyframe = False
+        self.error = None
+
+        # Stats
+        self.frames = 0
+        self.dropped = 0
+
+        self._thread = threading.Thread(target=self._writer, name="pypong-cast", daemon=True)
+        self._thread.start()
+
+    def frame(self, data, frame=None):
+        """Queue one frame's output bytes. ``frame`` is the full frame text,
+        used for the first frame's size and for keyframes after drops."""
+        now = time.monotonic()
+        if self._start is None:
+            self._start = now
+            lines = frame.split("\n") if frame else [""]
+            width = max(len(line) for line in lines) or 80
+            self._queue.put(("header", width, len(lines), time.time()))
+
+        if self.needs_keyframe:
+            if frame is None:
+                self.dropped += 1
+                return
+            data = self._renderer.keyframe(frame)
+        if not data:
+            return
+
+        item = (now - self._start, data)
+        if self.policy == "block":
+            self._queue.put(item)
+        else:
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                self.dropped += 1
+                self.needs_keyframe = True
+                return
+        self.needs_keyframe = False
+        self.frames += 1
+
+    def _write_header(self, width, height, timestamp):
+        if self.format == "raw":
+            self._file.write(MAGIC + RAW_HEADER.pack(width, height))
+            return
+        header = {"version": 2, "width": width, "height": height,
+                  "timestamp": int(timestamp)}
+        if self.title:
+            header["title"] = self.title
+        self._file.write(json.dumps(header) + "\n")
+
+    def _write_frame(self, elapsed, data):
+        if self.format == "raw":
+            self._file.write(RAW_RECORD.pack(elapsed, len(data)))
+            self._file.write(data)
+            return
+        text = data.decode("utf-8", "replace")
+        self._file.write(json.dumps([round(elapsed, 6), "o", text]) + "\n")
+
+    def _writer(self):
+        """Background thread: write queued items until told to stop."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            if self.error is not None:
+                continue
+            try:
+                if item[0] == "header":
+                    self._write_header(*item[1:])
+                else:
+                    self._write_frame(*item)
+                if self._queue.empty():
+                    self._file.flush()
+            except (OSError, ValueError) as error:
+                # Keep draining so the game loop never blocks on a dead file
+                self.error = error
+
+    def close(self):
+        """Write what is queued, stop the thread and close the file."""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        if self._owns_file:
+            self._file.close()
+        elif self.error is None:
+            self._file.flush()
+
+
+def read_raw(path):
+    """Yield (width, height) and then (seconds, bytes) for each frame of a raw log."""
+    with gzip.open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError("not a pypong raw frame log")
+        yield RAW_HEADER.unpack(f.read(RAW_HEADER.size))
+        while True:
+            record = f.read(RAW_RECORD.size)
+            if len(record) < RAW_RECORD.size:
+                return
+            elapsed, length = RAW_RECORD.unpack(record)
+            yield elapsed, f.read(length)
@@ -0,0 +1,207 @@
+import math
+
+from .spatial import PaddleIndex
+
+
+class CollisionHandler:
+    """Handles all ball collision detection and response.
+
+    With ``swept`` (the default) Game resolves each tick's ball move in one
+    analytic pass through ``sweep``; otherwise it checks ``bounce_walls``
+    and ``check_paddle`` after every ball substep.
+    """
+
+    __slots__ = ("court_top", "court_bottom", "min_dy", "max_dy", "swept")
+
+    def __init__(self, court_top=1.0, court_bottom=None, min_dy=0.3, max_dy=0.9,
+                 swept=True):
+        self.court_top = court_top
+        self.court_bottom = court_bottom
+        self.min_dy = min_dy
+        self.max_dy = max_dy
+        self.swept = swept
+
+    def set_bounds(self, height):
+        """Set court boundaries based on court height."""
+        self.court_bottom = float(height - 2)
+
+    def _fold(self, y):
+        """Reflect a y that left the court back between the walls.
+
+        Returns (y, direction) where direction is the sign of the vertical
+        motion after the last reflection. Any number of reflections costs
+        the same.
+        """
+        top = self.court_top
+        span = self.court_bottom - top
+        if span <= 0:
+            return top, 1
+        offset = y - top
+        q = math.floor(offset / span)
+        rest = offset - q * span
+        if q % 2 == 0:
+            y = top + rest
+        else:
+            y = self.court_bottom - rest
+        direction = 1 if (q % 2 == 0) == (q > 0) else -1
+        return y, direction
+
+    def _set_dy(self, ball, direction):
+        """Point dy up (-1) or down (1), keeping at least min_dy."""
+        ball.dy = max(abs(ball.dy), self.min_dy) * direction
+
+    def _clamp(self, ball):
+        """Hard clamp safety: keep the ball strictly inside the walls."""
+        if ball.y <= self.court_top:
+            ball.y = self.court_top + 0.5
+            self._set_dy(ball, 1)
+        if ball.y >= self.court_bottom:
+            ball.y = self.court_bottom - 0.5
+            self._set_dy(ball, -1)
+
+    def bounce_walls(self, ball):
+        """Handle ball bouncing off top and bottom walls. Returns True if bounced."""
+        bounced = ball.y < self.court_top or ball.y > self.court_bottom
+        if bounced:
+            ball.y, direction = self._fold(ball.y)
+            self._set_dy(ball, direction)
+        self._clamp(ball)
+        return bounced
+
+    def _move(self, ball, x, y, steps, events):
+        """Move the ball ``steps`` velocity steps from (x, y), folding walls."""
+        x += ball.dx * steps
+        y_end = y + ball.dy * steps
+        if self.court_top <= y_end <= self.court_bottom:
+            return x, y_end
+
+        if abs(ball.dy) < self.min_dy:
+            # bounce_walls speeds up a shallow ball at its first bounce:
+            # carry on past the wall at min_dy and let _fold reflect it
+            wall = self.court_top if y_end < self.court_top else self.court_bottom
+            t = (wall - y) / ball.dy
+            heading = 1 if ball.dy > 0 else -1
+            y_end = wall + heading * self.min_dy * (steps - t)
+
+        y, direction = self._fold(y_end)
+        self._set_dy(ball, direction)
+        events.append(("wall", None))
+        return x, y
+
+    def sweep(self, ball, x0, y0, paddles):
+        """Resolve a straight, unobstructed move from (x0, y0) to the ball's
+        current position against walls and paddle faces.
+
+        Times of impact are solved analytically, so the cost does not grow
+        with ball speed and fast balls cannot tunnel through paddles. The
+        ball is left at its resolved position. Returns the events in order
+        as (kind, paddle) pairs, kind being "wall", "hit" or "scored".
+        ``paddles`` is a PaddleIndex, or any list of paddles.
+        """
+        if not isinstance(paddles, PaddleIndex):
+            paddles = PaddleIndex(paddles)
+        events = []
+        if ball.dx:
+            remaining = (ball.x - x0) / ball.dx
+        elif ball.dy:
+            remaining = (ball.y - y0) / ball.dy
+        else:
+            return events
+
+        x, y = x0, y0
+        passed = []
+        while remaining > 0:
+            # Earliest paddle face the ball reaches this tick
+            first = None
+            for paddle in paddles.facing(ball.dx, x, x + ball.dx * remaining):
+                if paddle in passed:
+                    continue
+                face = paddle.x + 1 if paddle.side == "left" else paddle.x - 1
+                t = (face - x) / ball.dx
+                # A face at the start was already met when the ball arrived
+                if 0 < t <= remaining and (first is None or t < first[0]):
+                    first = (t, paddle, face)
+
+            if first is None:
+                x, y = self._move(ball, x, y, remaining, events)
+                break
+
+            t, paddle, face = first
+            x, y = self._move(ball, x, y, t, events)
+            remaining -= t
+            ball.x, ball.y = float(face), y
+
+            by = max(1, int(round(y)))
+            paddle_top = int(paddle.y)
+            if paddle_top <= by < paddle_top + paddle.height:
+                ball.dx = abs(ball.dx) if paddle.side == "left" else -abs(ball.dx)
+                self._apply_spin(ball, paddle)
+                events.append(("hit", paddle))
+                x = float(face)
+            else:
+                passed.append(paddle)
+
+        ball.x, ball.y = x, y
+        self._clamp(ball)
+
+        # Out of the court behind a paddle: the other side scores
+        for paddle in paddles:
+            if paddle.side == "left" and ball.dx < 0 and ball.x < 0:
+                events.append(("scored", paddle))
+                break
+            if paddle.side == "right" and ball.dx > 0 and ball.x >= paddle.court_width:
+                events.append(("scored", paddle))
+                break
+        return events
+
+    def check_paddle(self, ball, paddle):
+        """Check if ball hits a paddle after one substep. Returns True if hit.
+
+        Only a ball that crossed the paddle's face on this substep can be
+        returned, so a paddle never catches a ball that is already behind it.
+        """
+        by = int(round(ball.y))
+        by = max(1, by)
+        paddle_top = int(paddle.y)
+        paddle_bottom = paddle_top + paddle.height
+        previous = ball.x - ball.dx
+
+        if paddle.side == "left":
+            if ball.dx < 0:
+                face = paddle.x + 1
+                if ball.x <= face < previous and paddle_top <= by < paddle_bottom:
+                    ball.x = float(paddle.x + 2)
+                    ball.dx = abs(ball.dx)
+                    self._apply_spin(ball, paddle)
+                    return True
+                elif ball.x < 0:
+                    return "scored"
+
+        elif paddle.side == "right":
+            if ball.dx > 0:
+                face = paddle.x - 1
+                if previous < face <= ball.x and paddle_top <= by < paddle_bottom:
+                    ball.x = float(paddle.x - 2)
+                    ball.dx = -abs(ball.dx)
+                    self._apply_spin(ball, paddle)
+                    return True
+                elif ball.x >= paddle.court_width:
+                    return "scored"
+
+        return False
+
+    def _apply_spin(self, ball, paddle):
+        """Apply spin to ball based on where it hits the paddle."""
+        by = int(round(ball.y))
+        center = paddle.y + paddle.height / 2.0
+        offset = (by - center) / (paddle.height / 2.0)
+        ball.dy = offset * 1.0
+
+        if abs(ball.dy) < self.min_dy:
+            ball.dy = self.min_dy if ball.dy >= 0 else -self.min_dy
+        if ball.dy > self.max_dy:
+            ball.dy = self.max_dy
+        elif ball.dy < -self.max_dy:
+            ball.dy = -self.max_dy
+
+        ball.speed = min(ball.speed + ball.speed_increment, ball.max_speed)
@@ -15,6 +15,12 @@ class Court:
         self.net_char = net_char
         self.net_enabled = net_enabled
 
+    def key(self):
+        """Every setting that affects drawing, for caches to compare."""
+        return (self.width, self.height, self.border_h, self.border_v,
+                self.corner_tl, self.corner_tr, self.corner_bl, self.corner_br,
+                self.net_char, self.net_enabled)
+
     def top_border(self):
         """Return top border string."""
         return self.corner_tl + self.border_h * self.width + self.corner_tr
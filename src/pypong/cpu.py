@@ -1,15 +1,25 @@
 import random
 
+from .paddle import Paddle
+
 
 class CPU(Paddle):
     """AI-controlled paddle."""
 
-    # Import here to avoid circular imports at module level
-    def __init__(self, side="right", height=5, difficulty="medium",
-                 char="█", end_char=None):
-        # Import Paddle at runtime
-        from .paddle import Paddle as _Paddle
+    __slots__ = ("difficulty", "rng", "_reaction_timer", "_configs",
+                 "court_top", "court_bottom", "_predicted", "_predicted_for")
 
+    # Difficulty presets, shared by every CPU
+    CONFIGS = {
+        "easy": {"react_every": 6, "wobble": 4.0, "chase_always": False, "speed": 1},
+        "medium": {"react_every": 3, "wobble": 1.5, "chase_always": False, "speed": 2},
+        "hard": {"react_every": 1, "wobble": 0.0, "chase_always": True, "speed": 2},
+        "predict": {"react_every": 1, "wobble": 0.0, "chase_always": True, "speed": 2,
+                    "predict": True},
+    }
+
+    def __init__(self, side="right", height=5, difficulty="medium",
+                 char="█", end_char=None, seed=None, depth=1):
         # Initialize parent
         if end_char is None:
             end_char = "▐" if side == "left" else "▌"
@@ -21,6 +31,7 @@ class CPU(Paddle):
         self.end_char = end_char
         self.y = 0.0
         self.x = 0
+        self.depth = depth
         self.up_key = None
         self.down_key = None
         self.court_width = 0
@@ -30,22 +41,72 @@ class CPU(Paddle):
 
         # CPU specific
         self.difficulty = difficulty
+        self.rng = random.Random(seed)
         self._reaction_timer = 0
-        self._configs = {
-            "easy": {"react_every": 6, "wobble": 4.0, "chase_always": False, "speed": 1},
-            "medium": {"react_every": 3, "wobble": 1.5, "chase_always": False, "speed": 2},
-            "hard": {"react_every": 1, "wobble": 0.0, "chase_always": True, "speed": 2},
-        }
+        # Shared presets; assign a new dict to customise one CPU
+        self._configs = CPU.CONFIGS
+
+        # Intercept prediction
+        self.court_top = 1.0
+        self.court_bottom = None
+        self._predicted = None
+        self._predicted_for = None
 
     def setup(self, court_width, court_height):
         """Initialize CPU paddle."""
         self.court_width = court_width
         self.court_height = court_height
         if self.side == "left":
-            self.x = 1
+            self.x = self.depth
         else:
-            self.x = court_width - 2
+            self.x = court_width - 1 - self.depth
         self.y = float(court_height // 2 - self.height // 2)
+        if self.court_bottom is None:
+            self.court_bottom = float(court_height - 2)
+
+    def set_bounds(self, court_top, court_bottom):
+        """Set the wall positions used to fold predicted bounces."""
+        self.court_top = court_top
+        self.court_bottom = court_bottom
+        self._predicted_for = None
+
+    def _predict(self, ball):
+        """Predict the y where the ball reaches this paddle's face.
+
+        Wall bounces are folded analytically, and the result is cached
+        until the tracked ball or its velocity changes. Returns the court
+        centre when the ball is moving away.
+        """
+        key = (ball, ball.dx, ball.dy)
+        if key == self._predicted_for:
+            return self._predicted
+
+        if self.side == "left":
+            face_x = self.x + 1
+            incoming = ball.dx < 0
+        else:
+            face_x = self.x - 1
+            incoming = ball.dx > 0
+
+        if not incoming:
+            target = self.court_height / 2.0
+        else:
+            steps = (face_x - ball.x) / ball.dx
+            y = ball.y + ball.dy * max(steps, 0.0)
+
+            # Unfold the reflections off the top and bottom walls
+            top = self.court_top
+            span = self.court_bottom - top
+            if span > 0:
+                offset = (y - top) % (2 * span)
+                if offset > span:
+                    offset = 2 * span - offset
+                y = top + offset
+            target = y
+
+        self._predicted = target
+        self._predicted_for = key
+        return target
 
     def handle_input(self, keys):
         """CPU ignores keyboard input."""
@@ -60,11 +121,14 @@ class CPU(Paddle):
         if self._reaction_timer % config["react_every"] != 0:
             return
 
-        target_y = ball.y
+        if config.get("predict"):
+            target_y = self._predict(ball)
+        else:
+            target_y = ball.y
         paddle_center = self.y + self.height / 2.0
 
         # Add wobble for imprecision
-        target_y += random.uniform(-config["wobble"], config["wobble"])
+        target_y += self.rng.uniform(-config["wobble"], config["wobble"])
 
         # Only chase if ball coming toward us (or always on hard)
         should_chase = config["chase_always"]
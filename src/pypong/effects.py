@@ -0,0 +1,141 @@
+class EffectRing:
+    """Fixed-capacity ring of timed cell effects that all live ``ttl`` ticks.
+
+    Storage is preallocated parallel lists, so pushing, expiring and
+    drawing allocate nothing. Every entry lives the same number of ticks,
+    which keeps the ring in expiry order: expiring only ever drops from
+    the tail. When the ring is full the oldest entry is overwritten.
+    Each entry is a vertical run of ``length`` cells starting at (x, y),
+    or follows an ``owner`` paddle's current cells.
+    """
+
+    __slots__ = ("capacity", "ttl", "chars", "_x", "_y", "_length", "_char",
+                 "_owner", "_born", "_head", "_count")
+
+    def __init__(self, capacity, ttl, chars):
+        self.capacity = capacity
+        self.ttl = ttl
+        # Character for each age in ticks; None skips that age
+        self.chars = chars
+        self._x = [0] * capacity
+        self._y = [0] * capacity
+        self._length = [1] * capacity
+        self._char = [None] * capacity
+        self._owner = [None] * capacity
+        self._born = [0] * capacity
+        self._head = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def push(self, tick, x=0, y=0, length=1, char=None, owner=None):
+        """Add an effect born at tick. char overrides the age characters."""
+        i = self._head
+        self._x[i] = x
+        self._y[i] = y
+        self._length[i] = length
+        self._char[i] = char
+        self._owner[i] = owner
+        self._born[i] = tick
+        self._head = (i + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def expire(self, tick):
+        """Drop entries that have lived ttl ticks."""
+        capacity = self.capacity
+        born = self._born
+        tail = (self._head - self._count) % capacity
+        while self._count and tick - born[tail] >= self.ttl:
+            self._char[tail] = None
+            self._owner[tail] = None
+            tail = (tail + 1) % capacity
+            self._count -= 1
+
+    def clear(self):
+        for i in range(self.capacity):
+            self._char[i] = None
+            self._owner[i] = None
+        self._head = 0
+        self._count = 0
+
+    def stamp(self, fb, tick):
+        """Draw live entries, oldest first, onto a FrameBuffer."""
+        capacity = self.capacity
+        chars = self.chars
+        i = (self._head - self._count) % capacity
+        for _ in range(self._count):
+            char = self._char[i]
+            if char is None:
+                age = tick - self._born[i]
+                char = chars[age] if 0 <= age < len(chars) else None
+            if char is not None:
+                owner = self._owner[i]
+                if owner is None:
+                    x = self._x[i]
+                    y = self._y[i]
+                    length = self._length[i]
+                else:
+                    x = owner.x
+                    y = int(owner.y)
+                    length = owner.height
+                for row in range(y, y + length):
+                    fb.stamp(x, row, char)
+            i = (i + 1) % capacity
+
+
+class Effects:
+    """Ball trails, paddle hit flashes and score bursts.
+
+    Game feeds it ball positions every tick, a flash on every paddle hit
+    and a burst on every point; ``stamp`` draws what is still alive.
+    """
+
+    TRAIL_CHARS = (None, "◦", "∙", "·")
+    FLASH_CHARS = ("▓", "▓", "▒", "░")
+    BURST_CHARS = ("*", "*", "+", "+", "·", "·")
+
+    def __init__(self, capacity=256):
+        self.enabled = True
+        self.trail = EffectRing(capacity, len(self.TRAIL_CHARS), self.TRAIL_CHARS)
+        self.flashes = EffectRing(32, len(self.FLASH_CHARS), self.FLASH_CHARS)
+        self.bursts = EffectRing(64, len(self.BURST_CHARS), self.BURST_CHARS)
+
+    def after_tick(self, game):
+        """Expire old effects and extend the ball trails. Called every tick."""
+        tick = game.ticks
+        self.trail.expire(tick)
+        self.flashes.expire(tick)
+        self.bursts.expire(tick)
+        if not self.enabled:
+            return
+        for ball in game.balls:
+            if ball.trail_enabled and not ball.frozen:
+                x, y = ball.get_display_pos()
+                self.trail.push(tick, x, y)
+
+    def flash(self, paddle, tick):
+        """Light up a paddle that just hit the ball."""
+        if self.enabled:
+            self.flashes.push(tick, owner=paddle)
+
+    def burst(self, x, y, tick):
+        """Spray sparks where a ball left the court."""
+        if not self.enabled:
+            return
+        for dy in (-1, 0, 1):
+            self.bursts.push(tick, x, y + dy)
+        self.bursts.push(tick, x, y - 2, char="·")
+        self.bursts.push(tick, x, y + 2, char="·")
+
+    def clear(self):
+        self.trail.clear()
+        self.flashes.clear()
+        self.bursts.clear()
+
+    def stamp(self, fb, tick):
+        """Draw trails, then flashes over paddles, then bursts."""
+        self.trail.stamp(fb, tick)
+        self.flashes.stamp(fb, tick)
+        self.bursts.stamp(fb, tick)
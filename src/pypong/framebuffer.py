@@ -0,0 +1,56 @@
+class FrameBuffer:
+    """Cell buffer for the playing field.
+
+    The court (side borders and net) is drawn once. Moving objects are
+    stamped on top each frame and wiped back to the court on the next, so
+    a frame only touches the cells that objects occupy.
+    """
+
+    def __init__(self, court):
+        self.court = court
+        self.width = court.width
+        self.height = court.height
+        self._key = court.key()
+
+        # Static court rows, borders included
+        net_x = court.net_x()
+        self._static = []
+        for y in range(self.height):
+            row = [court.row_start()] + [" "] * self.width + [court.row_end()]
+            if 0 <= net_x < self.width:
+                row[net_x + 1] = court.get_net_char(y)
+            self._static.append(row)
+
+        self.rows = [list(row) for row in self._static]
+        self._text = ["".join(row) for row in self.rows]
+        self._stamped = []
+        self._dirty = set()
+
+    def matches(self, court):
+        """True if this buffer was built for the given court and its settings."""
+        return court is self.court and court.key() == self._key
+
+    def clear(self):
+        """Restore the cells stamped last frame to the static court."""
+        rows = self.rows
+        static = self._static
+        for cx, y in self._stamped:
+            rows[y][cx] = static[y][cx]
+            self._dirty.add(y)
+        self._stamped = []
+
+    def stamp(self, x, y, char):
+        """Draw a character at court coordinates, ignoring off-court cells."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.rows[y][x + 1] = char
+            self._stamped.append((x + 1, y))
+            self._dirty.add(y)
+
+    def lines(self):
+        """Return the field rows as strings, re-joining only changed rows."""
+        rows = self.rows
+        text = self._text
+        for y in self._dirty:
+            text[y] = "".join(rows[y])
+        self._dirty.clear()
+        return text
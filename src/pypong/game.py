@@ -1,13 +1,21 @@
-import sys
 import os
+import math
 import time
+import random
 
 from .ball import Ball
 from .paddle import Paddle
 from .court import Court
 from .cpu import CPU
 from .collision import CollisionHandler
-from .input import InputHandler
+from .renderer import Renderer
+from .spatial import PaddleIndex
+from .framebuffer import FrameBuffer
+from .template import FrameTemplate
+from .effects import Effects
+from .subcell import MODES as SUBCELL_MODES, SubCellCanvas
+from .timing import FrameStats
+from . import snapshot
 
 
 class Game:
@@ -16,11 +24,24 @@ class Game:
     def __init__(self, title="PyPong"):
         self.title = title
         self.paddles = []
+        self.paddle_index = PaddleIndex()
+        # Every ball in play; ``ball`` is the first one
+        self.balls = []
         self.ball = None
         self.court = None
         self.cpus = []
         self.collision = CollisionHandler()
         self.input_handler = None
+        self.output = None
+        self.renderer = Renderer()
+        self._framebuffer = None
+        self._template = FrameTemplate()
+        # Frame for the current state, shared by the terminal and spectators
+        self._frame = None
+        # Created by the first frame, so headless games skip the effect rings
+        self.effects = None
+        self.render_mode = "cell"
+        self._canvas = None
 
         # Scores
         self.scores = {}
@@ -34,8 +55,24 @@ class Game:
 
         # Timing
         self.tick_rate = 0.045
+        self.max_catchup = 5
+        self.stats = FrameStats()
+        self.profiler = None
         self.countdown = 0
-        self.countdown_timer = 0.0
+        self.countdown_ticks = 0
+
+        # Headless mode: no terminal, no sleeping
+        self.headless = False
+        self.ticks = 0
+        self._ready = False
+
+        # Determinism and replays; serves draw from this game's own generator
+        self.seed = None
+        self.rng = random.Random()
+        self.recorder = None
+        self.spectators = None
+        self.telemetry = None
+        self.cast = None
 
         # Sound
         self.sound_enabled = True
@@ -47,7 +84,11 @@ class Game:
         self.on_game_over = None
 
     def add(self, *objects):
-        """Add game objects (Paddles, Ball, Court, CPU)."""
+        """Add game objects (Paddles, Balls, Court, CPU).
+
+        Paddles may share a side at different depths, and any number of
+        balls can be added for multi-ball play.
+        """
         for obj in objects:
             if isinstance(obj, CPU):
                 self.paddles.append(obj)
@@ -57,7 +98,9 @@ class Game:
                 self.paddles.append(obj)
                 self.scores[obj.side] = 0
             elif isinstance(obj, Ball):
-                self.ball = obj
+                self.balls.append(obj)
+                if self.ball is None:
+                    self.ball = obj
             elif isinstance(obj, Court):
                 self.court = obj
         return self
@@ -72,16 +115,75 @@ class Game:
         self.tick_rate = rate
         return self
 
+    def set_render_mode(self, mode):
+        """Draw paddles and balls per "cell", or at sub-cell positions with
+        "half" (half blocks) or "braille" dots."""
+        if mode != "cell" and mode not in SUBCELL_MODES:
+            raise ValueError(f"unknown render mode {mode!r}")
+        self.render_mode = mode
+        self._canvas = None
+        self._frame = None
+        return self
+
     def set_sound(self, enabled):
         """Enable or disable terminal beep sound."""
         self.sound_enabled = enabled
         return self
 
+    def set_profiler(self, profiler):
+        """Attach a Profiler to time each phase of the loop (None to detach)."""
+        self.profiler = profiler
+        return self
+
+    def set_headless(self, enabled=True):
+        """Run without a terminal, input handler or sleeping."""
+        self.headless = enabled
+        return self
+
+    def set_seed(self, seed):
+        """Seed the ball and CPU random generators so matches are repeatable."""
+        self.seed = seed
+        return self
+
+    def set_recorder(self, recorder):
+        """Attach a ReplayRecorder that logs every tick's input (None to detach)."""
+        self.recorder = recorder
+        return self
+
+    def set_spectators(self, hub):
+        """Attach a SpectatorHub that streams every tick to viewers (None to detach)."""
+        self.spectators = hub
+        return self
+
+    def set_telemetry(self, telemetry):
+        """Attach a Telemetry that records every match event (None to detach)."""
+        self.telemetry = telemetry
+        return self
+
+    def set_cast(self, cast):
+        """Attach a CastRecorder that archives every frame sent (None to detach)."""
+        self.cast = cast
+        return self
+
+    def _apply_seed(self):
+        """Seed the serve generator and give each CPU its own derived stream."""
+        self.rng.seed(self.seed)
+        for index, cpu in enumerate(self.cpus):
+            cpu.rng.seed(self.seed * 1000 + index + 1)
+
+    def _ticks_per_count(self):
+        """Ticks in one second of countdown."""
+        return max(1, int(math.ceil(1.0 / self.tick_rate - 1e-9)))
+
+    def _start_countdown(self):
+        """Start the 3-2-1 countdown, measured in ticks."""
+        self.countdown = 3
+        self.countdown_ticks = self._ticks_per_count()
+
     def _beep(self):
         """Terminal bell sound."""
-        if self.sound_enabled:
-            sys.stdout.write('\a')
-            sys.stdout.flush()
+        if self.sound_enabled and self.output and not self.headless:
+            self.output.bell()
 
     def _setup(self):
         """Initialize all game objects."""
@@ -89,23 +191,47 @@ class Game:
             self.court = Court()
         if self.ball is None:
             self.ball = Ball()
+            self.balls.append(self.ball)
+
+        if self.recorder and self.seed is None:
+            self.seed = random.randrange(2 ** 32)
+        if self.seed is not None:
+            self._apply_seed()
 
         w = self.court.width
         h = self.court.height
 
-        self.ball.setup(w, h)
+        for ball in self.balls:
+            ball.rng = self.rng
+            ball.setup(w, h)
         self.collision.set_bounds(h)
 
         for paddle in self.paddles:
             paddle.setup(w, h)
+        self.paddle_index.rebuild(self.paddles)
+        for cpu in self.cpus:
+            cpu.set_bounds(self.collision.court_top, self.collision.court_bottom)
+
+        self._start_countdown()
+        self._ready = True
+
+        if self.recorder:
+            self.recorder.begin(self)
+        if self.telemetry:
+            self.telemetry.begin(self)
+
+        if self.headless:
+            return
+
+        # Terminal machinery is only loaded once a terminal game starts
+        from .input import InputHandler
+        from .output import OutputSink
 
         self.input_handler = InputHandler()
-        self.countdown = 3
-        self.countdown_timer = time.time()
+        self.output = OutputSink()
 
-        # Hide cursor
-        sys.stdout.write('\033[?25l')
-        sys.stdout.flush()
+        # Hide cursor (sent with the first frame)
+        self.output.write('\033[?25l')
 
     def _restart(self):
         """Restart the game."""
@@ -113,15 +239,25 @@ class Game:
             self.scores[side] = 0
         for paddle in self.paddles:
             paddle.reset()
-        self.ball.reset()
+        for ball in self.balls:
+            ball.reset()
+        if self.effects:
+            self.effects.clear()
+        if self.telemetry:
+            self.telemetry.begin(self)
         self.game_over = False
         self.winner = None
         self.paused = False
-        self.countdown = 3
-        self.countdown_timer = time.time()
+        self._start_countdown()
+        self.renderer.invalidate()
 
     def _handle_input(self, keys):
         """Process input for all paddles and game controls."""
+        if keys:
+            self._frame = None
+            if self.recorder:
+                self.recorder.record(self.ticks, keys)
+
         for key in keys:
             if key == 'q':
                 self.running = False
@@ -141,198 +277,387 @@ class Game:
 
         # Countdown
         if self.countdown > 0:
-            if time.time() - self.countdown_timer >= 1.0:
+            self.countdown_ticks -= 1
+            if self.countdown_ticks <= 0:
                 self.countdown -= 1
-                self.countdown_timer = time.time()
+                self.countdown_ticks = self._ticks_per_count()
             return
 
-        # Update ball
-        positions = self.ball.update(self.tick_rate)
-
-        for _ in positions:
-            # Wall bounces
-            if self.collision.bounce_walls(self.ball):
-                self._beep()
-                if self.on_wall_bounce:
-                    self.on_wall_bounce(self.ball)
-
-            # Paddle collisions
-            for paddle in self.paddles:
-                result = self.collision.check_paddle(self.ball, paddle)
-
-                if result == True:
-                    paddle.register_hit()
-                    # Reset other paddles combo
-                    for other in self.paddles:
-                        if other is not paddle:
-                            other.reset_combo()
-                    self._beep()
-                    if self.on_hit:
-                        self.on_hit(paddle, self.ball)
-
-                elif result == "scored":
-                    # Other side scored
-                    scoring_side = "right" if paddle.side == "left" else "left"
-                    self.scores[scoring_side] = self.scores.get(scoring_side, 0) + 1
-                    self._beep()
-
-                    if self.on_score:
-                        self.on_score(scoring_side, self.scores)
-
-                    # Check win
-                    if self.scores[scoring_side] >= self.win_score:
-                        self.game_over = True
-                        self.winner = scoring_side
-                        if self.on_game_over:
-                            self.on_game_over(self.winner, self.scores)
-                    else:
-                        direction = 1 if scoring_side == "left" else -1
-                        self.ball.reset(direction)
-                        self.countdown = 3
-                        self.countdown_timer = time.time()
-                    return
+        for ball in self.balls:
+            if self._update_ball(ball) and len(self.balls) == 1:
+                return
+            if self.game_over:
+                return
 
         # Update CPUs
         for cpu in self.cpus:
-            cpu.update(self.ball)
-
-    def _build_frame(self):
-        """Render the game as a string."""
-        lines = []
-        w = self.court.width
-        h = self.court.height
-
-        # Score header
-        left_name = "P1"
-        right_name = "P2"
-        for paddle in self.paddles:
-            if isinstance(paddle, CPU):
-                if paddle.side == "left":
-                    left_name = "CPU"
+            cpu.update(self._nearest_ball(cpu))
+
+    def _update_ball(self, ball):
+        """Move one ball and resolve its collisions. Returns True if it scored."""
+        if self.collision.swept:
+            # Let the ball fly freely, then resolve the whole move analytically
+            x0, y0 = ball.x, ball.y
+            ball.advance(self.tick_rate)
+            for event, paddle in self.collision.sweep(ball, x0, y0, self.paddle_index):
+                if event == "wall":
+                    self._wall_bounce(ball)
+                elif event == "hit":
+                    self._paddle_hit(paddle, ball)
                 else:
-                    right_name = "CPU"
-
-        left_score = self.scores.get("left", 0)
-        right_score = self.scores.get("right", 0)
-        header = f"  {left_name} [{left_score}]"
-        header2 = f"[{right_score}] {right_name}"
-        gap = w + 2 - len(header) - len(header2)
-        lines.append(header + " " * max(gap, 1) + header2)
-
-        # Spacer
-        lines.append("")
-
-        # Top border
-        lines.append(self.court.top_border())
-
-        # Ball position
-        bx, by = self.ball.get_display_pos()
-        show_ball = not self.ball.frozen or int(time.time() * 4) % 2 == 0
-
-        # Trail positions
-        trail_map = {}
-        if self.ball.trail_enabled and not self.ball.frozen:
-            for tx, ty, tc in self.ball.get_trail_positions():
-                trail_map[(tx, ty)] = tc
+                    self._point_scored(paddle, ball)
+                    return True
+        else:
+            for _ in ball.update(self.tick_rate):
+                # Wall bounces
+                if self.collision.bounce_walls(ball):
+                    self._wall_bounce(ball)
+
+                # Paddle collisions
+                for paddle in self.paddles:
+                    result = self.collision.check_paddle(ball, paddle)
+
+                    if result == True:
+                        self._paddle_hit(paddle, ball)
+                    elif result == "scored":
+                        self._point_scored(paddle, ball)
+                        return True
+        return False
+
+    def _nearest_ball(self, paddle):
+        """The ball a paddle should track: the closest one heading its way."""
+        if len(self.balls) == 1:
+            return self.ball
+        best = None
+        best_distance = None
+        for ball in self.balls:
+            if ball.frozen:
+                continue
+            if paddle.side == "left":
+                incoming = ball.dx < 0
+                distance = ball.x - paddle.x
+            else:
+                incoming = ball.dx > 0
+                distance = paddle.x - ball.x
+            if not incoming or distance < 0:
+                continue
+            if best is None or distance < best_distance:
+                best = ball
+                best_distance = distance
+        return best or self.ball
+
+    def _wall_bounce(self, ball):
+        """Ball bounced off the top or bottom wall."""
+        if self.telemetry:
+            self.telemetry.bounce(self, ball)
+        self._beep()
+        if self.on_wall_bounce:
+            self.on_wall_bounce(ball)
+
+    def _paddle_hit(self, paddle, ball):
+        """Ball was returned by a paddle."""
+        paddle.register_hit()
+        # Reset other paddles combo
+        for other in self.paddles:
+            if other is not paddle:
+                other.reset_combo()
+        # Effects count their age from the first frame that shows them
+        if self.effects:
+            self.effects.flash(paddle, self.ticks + 1)
+        if self.telemetry:
+            self.telemetry.hit(self, paddle, ball)
+        self._beep()
+        if self.on_hit:
+            self.on_hit(paddle, ball)
+
+    def _point_scored(self, paddle, ball):
+        """Ball got past a paddle: the other side scores."""
+        scoring_side = "right" if paddle.side == "left" else "left"
+        self.scores[scoring_side] = self.scores.get(scoring_side, 0) + 1
+        if self.effects:
+            edge = 0 if paddle.side == "left" else self.court.width - 1
+            self.effects.burst(edge, int(round(ball.y)), self.ticks + 1)
+        if self.telemetry:
+            self.telemetry.score(self, scoring_side, ball)
+        self._beep()
+
+        if self.on_score:
+            self.on_score(scoring_side, self.scores)
+
+        # Check win
+        if self.scores[scoring_side] >= self.win_score:
+            self.game_over = True
+            self.winner = scoring_side
+            if self.telemetry:
+                self.telemetry.game_over(self)
+            if self.on_game_over:
+                self.on_game_over(self.winner, self.scores)
+        else:
+            direction = 1 if scoring_side == "left" else -1
+            ball.reset(direction)
+            # With several balls in play the others keep going
+            if len(self.balls) == 1:
+                self._start_countdown()
+
+    def _tick(self):
+        """Run one simulation tick, then let the recorder and spectators see it."""
+        self._update()
+        self.ticks += 1
+        self._frame = None
+        if self.effects:
+            self.effects.after_tick(self)
+        if self.recorder:
+            self.recorder.after_tick(self)
+        if self.spectators:
+            self.spectators.after_tick(self)
+
+    def step(self, keys=None):
+        """Advance the game by exactly one tick without rendering or sleeping.
+
+        The first call sets the game up in headless mode. Returns False
+        once the game has been quit.
+        """
+        if not self._ready:
+            self.headless = True
+            self._setup()
 
-        # Paddle cells
-        paddle_map = {}
-        for paddle in self.paddles:
-            for px, py, pc in paddle.get_cells():
-                paddle_map[(px, py)] = pc
+        profiler = self.profiler
+        start = time.perf_counter() if profiler else 0.0
 
-        # Net x
-        net_x = self.court.net_x()
+        self._handle_input(keys or [])
+        self._tick()
 
-        # Draw field
-        for y in range(h):
-            row = [self.court.row_start()]
-            for x in range(w):
-                drawn = False
+        if profiler:
+            profiler.record("update", time.perf_counter() - start)
+            profiler.end_frame()
+        return self.running
 
-                # Ball
-                if not drawn and x == bx and y == by and show_ball:
-                    row.append(self.ball.char)
-                    drawn = True
+    def snapshot(self, rng=True):
+        """Pack the game state into a compact binary record."""
+        return snapshot.dumps(self, rng)
 
-                # Trail
-                if not drawn and (x, y) in trail_map:
-                    row.append(trail_map[(x, y)])
-                    drawn = True
+    def restore(self, data):
+        """Load a record made by snapshot() into this game."""
+        snapshot.loads(self, data)
+        self._frame = None
+        if self.effects:
+            self.effects.clear()
+        self.renderer.invalidate()
+        return self
 
-                # Paddles
-                if not drawn and (x, y) in paddle_map:
-                    row.append(paddle_map[(x, y)])
-                    drawn = True
+    def _close_attachments(self):
+        """Flush and close the profiler, recorders and telemetry at exit."""
+        if self.profiler:
+            self.profiler.close()
+        if self.recorder:
+            self.recorder.close()
+        if self.telemetry:
+            self.telemetry.close()
+        if self.cast:
+            self.cast.close()
+
+    async def run_async(self, writer=None, input_queue=None, exit_on_game_over=False):
+        """Run the game as an asyncio task instead of blocking the loop.
+
+        The game runs headless. Ticks are scheduled
+        with ``asyncio.sleep`` and keys are taken from ``input_queue`` (an
+        ``asyncio.Queue`` of key names). Frames are diff-encoded and written
+        to ``writer``, any object with ``write(bytes)`` and an optional
+        coroutine ``drain()`` such as an ``asyncio.StreamWriter``. Stop the
+        task by setting ``running`` to False or pressing 'q'.
+        """
+        import asyncio
+
+        self.headless = True
+        if not self._ready:
+            self._setup()
+        self.renderer.invalidate()
 
-                # Net
-                if not drawn and x == net_x:
-                    row.append(self.court.get_net_char(y))
-                    drawn = True
+        loop = asyncio.get_running_loop()
+        drain = getattr(writer, "drain", None)
+        next_tick = loop.time()
 
-                if not drawn:
-                    row.append(" ")
+        if writer is not None:
+            writer.write(b'\033[?25l')
 
-            row.append(self.court.row_end())
-            lines.append("".join(row))
+        try:
+            while self.running:
+                keys = []
+                if input_queue is not None:
+                    while not input_queue.empty():
+                        keys.append(input_queue.get_nowait())
+
+                # Run due ticks, catching up if the event loop fell behind
+                updates = 0
+                now = loop.time()
+                while now >= next_tick and updates < self.max_catchup:
+                    self.step(keys)
+                    keys = []
+                    next_tick += self.tick_rate
+                    updates += 1
+                if now >= next_tick:
+                    next_tick = now + self.tick_rate
+                if keys:
+                    self._handle_input(keys)
+
+                if writer is not None and updates:
+                    frame = self.frame()
+                    data = self.renderer.encode(frame)
+                    if self.cast:
+                        self.cast.frame(data, frame)
+                    if data:
+                        writer.write(data)
+                        if drain:
+                            await drain()
+
+                if exit_on_game_over and self.game_over:
+                    break
+
+                await asyncio.sleep(max(0.0, next_tick - loop.time()))
+        finally:
+            self._close_attachments()
+            if writer is not None:
+                writer.write(b'\033[?25h')
+                if drain:
+                    await drain()
 
-        # Bottom border
-        lines.append(self.court.bottom_border())
+        return self.winner
 
-        # Controls
-        control_parts = []
-        for paddle in self.paddles:
-            if not isinstance(paddle, CPU) and paddle.up_key and paddle.down_key:
-                name = "P1" if paddle.side == "left" else "P2"
-                control_parts.append(f"{paddle.up_key.upper()}/{paddle.down_key.upper()}:{name}")
-        control_parts.extend(["P:Pause", "Q:Quit", "R:Restart"])
-        lines.append("  " + "  ".join(control_parts))
+    def frame(self):
+        """The current frame as text, built at most once per tick or input."""
+        if self._frame is None:
+            self._frame = self._build_frame()
+        return self._frame
 
-        # Status
-        if self.countdown > 0:
-            lines.append(f"\n          >>> Get ready... {self.countdown} <<<")
-        elif self.paused:
-            lines.append(f"\n          >>> PAUSED - Press P to resume <<<")
-        elif self.game_over:
-            winner_name = left_name if self.winner == "left" else right_name
-            lines.append(f"\n          >>> {winner_name} WINS! R:Restart Q:Quit <<<")
+    def _build_frame(self):
+        """Render the game as a string."""
+        # Header, borders, controls and status come from the template cache
+        template = self._template.update(self)
+        lines = list(template.head)
+
+        # Field
+        fb = self._framebuffer
+        if fb is None or not fb.matches(self.court):
+            fb = self._framebuffer = FrameBuffer(self.court)
+        fb.clear()
+
+        # Paddles, then effects, then balls so later stamps win
+        if self.render_mode == "cell":
+            for paddle in self.paddles:
+                for px, py, pc in paddle.get_cells():
+                    fb.stamp(px, py, pc)
         else:
-            lines.append("")
-
-        # Padding
-        for _ in range(3):
-            lines.append(" " * (w + 2))
+            canvas = self._canvas
+            if canvas is None or not canvas.matches(self.court, self.render_mode):
+                canvas = self._canvas = SubCellCanvas(self.court.width, self.court.height,
+                                                      self.render_mode)
+            for paddle in self.paddles:
+                canvas.vline(paddle.x, paddle.y, paddle.height)
+            canvas.stamp(fb)
+
+        if self.effects is None:
+            self.effects = Effects()
+        self.effects.stamp(fb, self.ticks)
+
+        # Blink at 2 Hz of game time, so frames depend only on the tick
+        blink_on = int(self.ticks * self.tick_rate * 4) % 2 == 0
+        for ball in self.balls:
+            if not ball.frozen or blink_on:
+                if self.render_mode == "cell":
+                    bx, by = ball.get_display_pos()
+                    fb.stamp(bx, by, ball.char)
+                else:
+                    canvas.dot(ball.x, ball.y)
+        if self.render_mode != "cell":
+            canvas.stamp(fb)
 
+        lines.extend(fb.lines())
+        lines.extend(template.tail)
         return "\n".join(lines)
 
     def run(self):
         """Start the game loop."""
+        import shutil
+
         try:
+            self.headless = False
             self._setup()
             os.system('cls' if os.name == 'nt' else 'clear')
+            term_size = shutil.get_terminal_size()
+
+            clock = time.perf_counter
+            previous = clock()
+            lag = 0.0
+            skipped = 0
 
             while self.running:
-                start = time.time()
+                now = clock()
+                lag += now - previous
+                previous = now
+
+                profiler = self.profiler
 
                 keys = self.input_handler.read_keys()
                 self._handle_input(keys)
-                self._update()
-
-                frame = self._build_frame()
-                sys.stdout.write('\033[H')
-                sys.stdout.write(frame)
-                sys.stdout.flush()
-
-                elapsed = time.time() - start
-                sleep = self.tick_rate - elapsed
+                update_start = clock()
+                if profiler:
+                    profiler.record("input", update_start - now)
+
+                # Fixed timestep: run as many ticks as real time demands
+                updates = 0
+                while lag >= self.tick_rate and updates < self.max_catchup:
+                    tick_start = clock() if profiler else 0.0
+                    self._tick()
+                    if profiler:
+                        profiler.record("update", clock() - tick_start)
+                    lag -= self.tick_rate
+                    updates += 1
+                if lag >= self.tick_rate:
+                    # Too far behind to catch up; drop the backlog
+                    lag %= self.tick_rate
+                self.stats.record_ticks(updates, clock() - update_start)
+
+                # Skip the render when the next tick is already due
+                behind = clock() - previous + lag >= self.tick_rate
+                if behind and skipped < self.max_catchup:
+                    skipped += 1
+                    self.stats.record_drop()
+                    continue
+                skipped = 0
+
+                # Repaint everything if the terminal was resized
+                size = shutil.get_terminal_size()
+                if size != term_size:
+                    term_size = size
+                    self.renderer.invalidate()
+
+                build_start = clock()
+                frame = self.frame()
+                write_start = clock()
+                data = self.renderer.encode(frame)
+                self.output.write(data)
+                self.output.flush()
+                if self.cast:
+                    self.cast.frame(data, frame)
+                write_end = clock()
+                self.stats.record_frame(write_start - build_start, write_end - write_start)
+                if profiler:
+                    profiler.record("build", write_start - build_start)
+                    profiler.record("write", write_end - write_start)
+                    profiler.end_frame()
+
+                # Sleep until the next tick, waking early on key presses
+                sleep = self.tick_rate - lag - (write_end - previous)
                 if sleep > 0:
-                    time.sleep(sleep)
+                    self.input_handler.wait(sleep)
 
         except KeyboardInterrupt:
             pass
         finally:
             self.input_handler.cleanup()
-            sys.stdout.write('\033[?25h')
-            sys.stdout.flush()
+            if self.output:
+                self.output.write('\033[?25h')
+                self.output.flush()
             os.system('cls' if os.name == 'nt' else 'clear')
             print(f"\n  Thanks for playing {self.title}! 🏓\n")
+            self._close_attachments()
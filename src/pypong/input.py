@@ -1,5 +1,6 @@
 import sys
 import os
+import time
 
 WINDOWS = os.name == 'nt'
 
@@ -8,48 +9,152 @@ if WINDOWS:
 else:
     import tty
     import termios
-    import select
+    import selectors
+
+# Escape sequence tails for arrow and navigation keys (after ESC [ or ESC O)
+ESCAPE_KEYS = {
+    'A': 'up',
+    'B': 'down',
+    'C': 'right',
+    'D': 'left',
+    'H': 'home',
+    'F': 'end',
+}
+
+# Second byte after a 0x00/0xE0 prefix from msvcrt.getch()
+WINDOWS_KEYS = {
+    b'H': 'up',
+    b'P': 'down',
+    b'M': 'right',
+    b'K': 'left',
+    b'G': 'home',
+    b'O': 'end',
+}
 
 
 class InputHandler:
-    """Cross-platform non-blocking keyboard input."""
+    """Cross-platform non-blocking keyboard input.
+
+    On POSIX all pending bytes are read with a single ``os.read`` on the raw
+    fd and parsed into keys, including arrow keys ('up', 'down', 'left',
+    'right'). ``wait`` blocks until input arrives or a timeout passes, so a
+    game loop can wake immediately on a key press.
+    """
 
-    def __init__(self):
+    def __init__(self, read_size=1024):
         self._original_settings = None
+        self._read_size = read_size
+        self._pending = ""
+        self._queue = []
+        self._selector = None
         if not WINDOWS:
-            self._original_settings = termios.tcgetattr(sys.stdin)
-            tty.setcbreak(sys.stdin.fileno())
+            self._fd = sys.stdin.fileno()
+            self._original_settings = termios.tcgetattr(self._fd)
+            tty.setcbreak(self._fd)
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self._fd, selectors.EVENT_READ)
 
-    def get_key(self):
-        """Read a single key without blocking. Returns None if no key pressed."""
+    def _read_windows(self):
+        """Drain msvcrt's key buffer into a list of keys."""
+        keys = []
+        while msvcrt.kbhit():
+            ch = msvcrt.getch()
+            if ch in (b'\x00', b'\xe0'):
+                name = WINDOWS_KEYS.get(msvcrt.getch())
+                if name:
+                    keys.append(name)
+                continue
+            try:
+                keys.append(ch.decode('utf-8').lower())
+            except UnicodeDecodeError:
+                pass
+        return keys
+
+    def _parse(self, text):
+        """Split raw terminal text into keys. Keeps an incomplete escape pending."""
+        keys = []
+        i = 0
+        n = len(text)
+        while i < n:
+            ch = text[i]
+            if ch != '\x1b':
+                keys.append(ch.lower())
+                i += 1
+                continue
+
+            # ESC [ ... final byte, or ESC O x
+            if i + 1 >= n:
+                self._pending = text[i:]
+                break
+            intro = text[i + 1]
+            if intro not in '[O':
+                keys.append('esc')
+                i += 1
+                continue
+
+            j = i + 2
+            while j < n and not ('@' <= text[j] <= '~'):
+                j += 1
+            if j >= n:
+                self._pending = text[i:]
+                break
+            name = ESCAPE_KEYS.get(text[j])
+            if name:
+                keys.append(name)
+            i = j + 1
+        return keys
+
+    def _read_posix(self):
+        """Read every pending byte in one os.read and parse it into keys."""
+        if not self._selector.select(0):
+            # A lone ESC with nothing after it is the escape key itself
+            if self._pending == '\x1b':
+                self._pending = ""
+                return ['esc']
+            return []
+        data = os.read(self._fd, self._read_size)
+        text = self._pending + data.decode('utf-8', errors='ignore')
+        self._pending = ""
+        return self._parse(text)
+
+    def _fill(self):
+        """Move newly available keys into the queue."""
         if WINDOWS:
-            if msvcrt.kbhit():
-                ch = msvcrt.getch()
-                if ch in (b'\x00', b'\xe0'):
-                    msvcrt.getch()
-                    return None
-                try:
-                    return ch.decode('utf-8').lower()
-                except:
-                    return None
-            return None
+            self._queue.extend(self._read_windows())
         else:
-            if select.select([sys.stdin], [], [], 0)[0]:
-                ch = sys.stdin.read(1)
-                return ch.lower()
-            return None
+            self._queue.extend(self._read_posix())
+
+    def get_key(self):
+        """Read a single key without blocking. Returns None if no key pressed."""
+        if not self._queue:
+            self._fill()
+        if self._queue:
+            return self._queue.pop(0)
+        return None
 
     def read_keys(self, max_keys=15):
-        """Read all available keys. Returns list of key characters."""
-        keys = []
-        for _ in range(max_keys):
-            key = self.get_key()
-            if key is None:
-                break
-            keys.append(key)
+        """Read available keys, up to max_keys. Returns list of key names.
+
+        Keys past the limit stay queued for the next call.
+        """
+        self._fill()
+        keys = self._queue[:max_keys]
+        del self._queue[:max_keys]
         return keys
 
+    def wait(self, timeout):
+        """Block until input is ready or timeout seconds pass. Returns True on input."""
+        if self._queue:
+            return True
+        if timeout <= 0:
+            return False
+        if WINDOWS:
+            time.sleep(timeout)
+            return msvcrt.kbhit()
+        return bool(self._selector.select(timeout))
+
     def cleanup(self):
         """Restore terminal to original state."""
         if not WINDOWS and self._original_settings:
-            termios.tcsetattr(sys.stdin, termios.TCSADRAIN, self._original_settings)
+            termios.tcsetattr(self._fd, termios.TCSADRAIN, self._original_settings)
+            self._selector.close()
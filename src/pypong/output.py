@@ -0,0 +1,101 @@
+import os
+import select
+import sys
+
+WINDOWS = os.name == 'nt'
+
+
+class OutputSink:
+    """Batches everything written to the terminal into one write per frame.
+
+    Text, escape sequences and bells are encoded into a reused bytearray
+    and sent by ``flush`` with a single ``os.write`` on the terminal fd,
+    looping only if the kernel accepts part of it. Bells rung during a
+    frame are coalesced into one. On Windows, or when stdout has no real
+    fd, the bytes go through ``sys.stdout.buffer`` instead.
+    """
+
+    def __init__(self, fd=None):
+        sys.stdout.flush()
+        self._fd = fd
+        if fd is None and not WINDOWS:
+            try:
+                self._fd = sys.stdout.fileno()
+            except (AttributeError, OSError, ValueError):
+                self._fd = None
+        self._buffer = bytearray()
+        self._end = 0
+        self._bell = False
+
+        # Stats
+        self.syscalls = 0
+        self.last_syscalls = 0
+        self.partial_writes = 0
+        self.frames = 0
+        self.total_bytes = 0
+
+    def write(self, data):
+        """Queue text or bytes for the next flush."""
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        end = self._end + len(data)
+        if end > len(self._buffer):
+            self._buffer.extend(bytes(end - len(self._buffer)))
+        # Same-size slice assignment keeps the buffer's allocation
+        self._buffer[self._end:end] = data
+        self._end = end
+
+    def bell(self):
+        """Ring the terminal bell with the next flush (at most once)."""
+        self._bell = True
+
+    def _send(self, view):
+        """Write all of view to the fd, resuming after partial writes."""
+        sent = 0
+        total = len(view)
+        while sent < total:
+            try:
+                written = os.write(self._fd, view[sent:])
+            except BlockingIOError:
+                # Non-blocking terminal is full: wait until it drains
+                select.select([], [self._fd], [])
+                continue
+            self.syscalls += 1
+            self.last_syscalls += 1
+            if written < total - sent:
+                self.partial_writes += 1
+            sent += written
+
+    def flush(self):
+        """Send the queued frame. Returns the number of bytes written."""
+        if self._bell:
+            self._bell = False
+            self.write(b"\a")
+        end = self._end
+        self._end = 0
+        self.last_syscalls = 0
+        self.frames += 1
+        if not end:
+            return 0
+
+        with memoryview(self._buffer)[:end] as data:
+            if self._fd is None:
+                stream = getattr(sys.stdout, "buffer", None)
+                if stream is not None:
+                    stream.write(data)
+                    stream.flush()
+                else:
+                    sys.stdout.write(data.tobytes().decode("utf-8"))
+                    sys.stdout.flush()
+                self.syscalls += 1
+                self.last_syscalls = 1
+            else:
+                self._send(data)
+        self.total_bytes += end
+        return end
+
+    def syscalls_per_frame(self):
+        """Average write calls per flushed frame so far."""
+        if self.frames == 0:
+            return 0.0
+        return self.syscalls / self.frames
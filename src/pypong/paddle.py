@@ -1,8 +1,12 @@
 class Paddle:
     """A player-controlled paddle."""
 
+    __slots__ = ("side", "height", "speed", "char", "end_char", "y", "x",
+                 "up_key", "down_key", "court_width", "court_height",
+                 "hits", "combo", "depth")
+
     def __init__(self, side="left", height=5, speed=2,
-                 up_key=None, down_key=None, char="█", end_char=None):
+                 up_key=None, down_key=None, char="█", end_char=None, depth=1):
         self.side = side
         self.height = height
         self.speed = speed
@@ -10,6 +14,8 @@ class Paddle:
         self.end_char = end_char or ("▐" if side == "left" else "▌")
         self.y = 0.0
         self.x = 0
+        # Columns in front of the goal line; use several depths for doubles
+        self.depth = depth
 
         # Keys
         if up_key and down_key:
@@ -34,9 +40,9 @@ class Paddle:
         self.court_width = court_width
         self.court_height = court_height
         if self.side == "left":
-            self.x = 1
+            self.x = self.depth
         else:
-            self.x = court_width - 2
+            self.x = court_width - 1 - self.depth
         self.y = float(court_height // 2 - self.height // 2)
 
     def reset(self):
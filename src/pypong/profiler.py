@@ -0,0 +1,92 @@
+import json
+import sys
+from collections import deque
+
+
+PHASES = ("input", "update", "build", "write")
+
+
+class Profiler:
+    """Opt-in per-phase frame profiler for Game.
+
+    Keeps a rolling window of timings for each phase (input, update, build,
+    write) and reports p50/p95/p99. If ``stream`` is a path, every frame is
+    also appended to it as a JSON line. Attach with ``Game.set_profiler``.
+    A game without a profiler pays only a ``None`` check per phase.
+    """
+
+    def __init__(self, window=2048, stream=None, dump_on_exit=True):
+        self.window = window
+        self.dump_on_exit = dump_on_exit
+        self.samples = {phase: deque(maxlen=window) for phase in PHASES}
+        self.counts = {phase: 0 for phase in PHASES}
+        self.frames = 0
+
+        self._frame = {}
+        self._stream = open(stream, "a") if stream else None
+
+    def record(self, phase, seconds):
+        """Record one timing for a phase."""
+        samples = self.samples.get(phase)
+        if samples is None:
+            samples = self.samples[phase] = deque(maxlen=self.window)
+            self.counts[phase] = 0
+        samples.append(seconds)
+        self.counts[phase] += 1
+        self._frame[phase] = self._frame.get(phase, 0.0) + seconds
+
+    def end_frame(self):
+        """Close the current frame, streaming it if a file is attached."""
+        self.frames += 1
+        if self._stream:
+            row = {phase: round(t * 1000, 4) for phase, t in self._frame.items()}
+            row["frame"] = self.frames
+            self._stream.write(json.dumps(row) + "\n")
+        self._frame = {}
+
+    @staticmethod
+    def _percentile(ordered, pct):
+        """Nearest-rank percentile of a sorted list."""
+        if not ordered:
+            return 0.0
+        index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def percentiles(self, phase):
+        """Return p50/p95/p99/max in milliseconds for a phase's window."""
+        ordered = sorted(self.samples.get(phase, ()))
+        return {
+            "count": self.counts.get(phase, 0),
+            "p50": self._percentile(ordered, 50) * 1000,
+            "p95": self._percentile(ordered, 95) * 1000,
+            "p99": self._percentile(ordered, 99) * 1000,
+            "max": (ordered[-1] if ordered else 0.0) * 1000,
+        }
+
+    def summary(self):
+        """Percentiles for every phase that has samples."""
+        return {phase: self.percentiles(phase)
+                for phase, samples in self.samples.items() if samples}
+
+    def format_summary(self):
+        """Human readable summary table."""
+        lines = [f"  {'phase':<8}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"]
+        for phase, s in self.summary().items():
+            lines.append(f"  {phase:<8}{s['count']:>8}{s['p50']:>10.3f}{s['p95']:>10.3f}"
+                         f"{s['p99']:>10.3f}{s['max']:>10.3f}")
+        return "\n".join(lines)
+
+    def dump(self, file=None):
+        """Write the summary table to a file object (stdout by default)."""
+        file = file or sys.stdout
+        file.write(self.format_summary() + "\n")
+
+    def close(self):
+        """Flush the stream and dump the summary if configured."""
+        if self._stream:
+            if self.dump_on_exit:
+                self._stream.write(json.dumps({"summary": self.summary()}) + "\n")
+            self._stream.close()
+            self._stream = None
+        elif self.dump_on_exit:
+            self.dump()
@@ -0,0 +1,96 @@
+class Renderer:
+    """Encodes frames for the terminal, sending only the cells that changed."""
+
+    def __init__(self, merge_gap=4):
+        self.merge_gap = merge_gap
+        self._lines = None
+
+        # Stats
+        self.bytes_written = 0
+        self.total_bytes = 0
+        self.frames = 0
+        self.full_redraws = 0
+
+    def invalidate(self):
+        """Force a full redraw on the next frame (resize, restart)."""
+        self._lines = None
+
+    def _full(self, lines):
+        """Build output that repaints the whole screen."""
+        self.full_redraws += 1
+        return "\033[H\033[2J" + "\n".join(lines)
+
+    def _diff_row(self, row, old, new, out):
+        """Append cursor-positioned writes for changed runs in one row."""
+        old_len = len(old)
+        new_len = len(new)
+        common = min(old_len, new_len)
+        x = 0
+
+        while x < common:
+            if old[x] == new[x]:
+                x += 1
+                continue
+
+            # Extend the run, swallowing short unchanged gaps
+            start = x
+            end = x + 1
+            gap = 0
+            x += 1
+            while x < common and gap <= self.merge_gap:
+                if old[x] != new[x]:
+                    end = x + 1
+                    gap = 0
+                else:
+                    gap += 1
+                x += 1
+            out.append(f"\033[{row + 1};{start + 1}H{new[start:end]}")
+            x = end
+
+        # Row changed length: rewrite the tail and clear the rest
+        if new_len != old_len:
+            out.append(f"\033[{row + 1};{common + 1}H{new[common:]}\033[K")
+
+    def build(self, frame):
+        """Return the escape string that turns the last frame into this one."""
+        lines = frame.split("\n")
+        previous = self._lines
+
+        if previous is None:
+            output = self._full(lines)
+        else:
+            out = []
+            for row, (old, new) in enumerate(zip(previous, lines)):
+                if old != new:
+                    self._diff_row(row, old, new, out)
+            # Frame grew or shrank: write the new rows or clear the old ones
+            for row in range(len(previous), len(lines)):
+                out.append(f"\033[{row + 1};1H{lines[row]}\033[K")
+            if len(lines) < len(previous):
+                out.append(f"\033[{len(lines) + 1};1H\033[J")
+            output = "".join(out)
+
+        self._lines = lines
+        return output
+
+    def _record(self, nbytes):
+        """Count the bytes sent for one frame."""
+        self.bytes_written = nbytes
+        self.total_bytes += nbytes
+        self.frames += 1
+
+    def encode(self, frame):
+        """Return the changes for a frame as UTF-8 bytes, recording their size."""
+        data = self.build(frame).encode("utf-8")
+        self._record(len(data))
+        return data
+
+    def keyframe(self, frame):
+        """Return a full repaint of a frame as UTF-8 bytes, leaving the diff state alone."""
+        return ("\033[H\033[2J" + frame).encode("utf-8")
+
+    def average_bytes(self):
+        """Average bytes written per frame so far."""
+        if self.frames == 0:
+            return 0.0
+        return self.total_bytes / self.frames
@@ -0,0 +1,256 @@
+import struct
+import time
+
+from .court import Court
+
+
+# A replay stream is a sequence of tagged records. Each match starts with a
+# header, so a file can have any number of matches appended to it.
+#
+#   H  seed, tick rate, win score, court width/height, snapshot interval
+#   K  tick delta (varint), key count, keys (length-prefixed UTF-8)
+#   S  tick delta (varint), length (varint), Game.snapshot() bytes
+#   E  tick delta (varint)                      end of match
+#
+# Tick deltas count from the previous record of the same match.
+HEADER = struct.Struct("<QdHHHI")
+
+TAG_HEADER = b"H"
+TAG_KEYS = b"K"
+TAG_SNAPSHOT = b"S"
+TAG_END = b"E"
+
+
+class ReplayError(ValueError):
+    """Raised for malformed replay streams."""
+
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, offset):
+    value = 0
+    shift = 0
+    while True:
+        if offset >= len(data):
+            raise ReplayError("truncated varint")
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+class ReplayRecorder:
+    """Records a game's inputs so it can be replayed bit for bit.
+
+    Only the seed and each tick's key lists are stored, plus a
+    ``Game.snapshot()`` every ``snapshot_every`` ticks for seeking (0 turns
+    snapshots off). Attach with ``Game.set_recorder``; records are appended
+    to ``target`` (a path or a binary file object).
+    """
+
+    def __init__(self, target, snapshot_every=5000, buffer_size=64 * 1024):
+        if isinstance(target, str):
+            self._file = open(target, "ab")
+            self._owns_file = True
+        else:
+            self._file = target
+            self._owns_file = False
+        self.snapshot_every = snapshot_every
+        self.buffer_size = buffer_size
+        self._buffer = bytearray()
+        self._game = None
+        self._last_tick = 0
+
+    def _delta(self, tick):
+        delta = tick - self._last_tick
+        self._last_tick = tick
+        return delta
+
+    def begin(self, game):
+        """Start a new match record. Called by Game._setup."""
+        if self._game is not None:
+            self.end()
+        self._game = game
+        self._last_tick = game.ticks
+        self._buffer += TAG_HEADER
+        self._buffer += HEADER.pack(game.seed, game.tick_rate, game.win_score,
+                                    game.court.width, game.court.height,
+                                    self.snapshot_every)
+
+    def record(self, tick, keys):
+        """Log the keys handled before the given tick."""
+        out = self._buffer
+        out += TAG_KEYS
+        _write_varint(out, self._delta(tick))
+        out.append(min(len(keys), 255))
+        for key in keys[:255]:
+            encoded = key.encode("utf-8")
+            out.append(len(encoded))
+            out += encoded
+        if len(out) >= self.buffer_size:
+            self.flush()
+
+    def after_tick(self, game):
+        """Write a periodic snapshot. Called by Game after every tick."""
+        if self.snapshot_every and game.ticks % self.snapshot_every == 0:
+            data = game.snapshot()
+            out = self._buffer
+            out += TAG_SNAPSHOT
+            _write_varint(out, self._delta(game.ticks))
+            _write_varint(out, len(data))
+            out += data
+            if len(out) >= self.buffer_size:
+                self.flush()
+
+    def end(self):
+        """Close the current match record."""
+        if self._game is None:
+            return
+        self._buffer += TAG_END
+        _write_varint(self._buffer, self._delta(self._game.ticks))
+        self._game = None
+        self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer = bytearray()
+        self._file.flush()
+
+    def close(self):
+        """End the match and close the file if the recorder opened it."""
+        self.end()
+        if self._owns_file:
+            self._file.close()
+
+
+class Replay:
+    """One recorded match, ready to play back or seek."""
+
+    def __init__(self, seed, tick_rate, win_score, width, height, snapshot_every):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.win_score = win_score
+        self.width = width
+        self.height = height
+        self.snapshot_every = snapshot_every
+        self.inputs = {}
+        self.snapshots = []
+        self.end_tick = None
+
+    @classmethod
+    def read_all(cls, source):
+        """Parse every match in a replay file (path or bytes)."""
+        if isinstance(source, str):
+            with open(source, "rb") as f:
+                data = f.read()
+        else:
+            data = bytes(source)
+
+        replays = []
+        current = None
+        tick = 0
+        offset = 0
+        while offset < len(data):
+            tag = data[offset:offset + 1]
+            offset += 1
+
+            if tag == TAG_HEADER:
+                current = cls(*HEADER.unpack_from(data, offset))
+                offset += HEADER.size
+                replays.append(current)
+                tick = 0
+                continue
+            if current is None:
+                raise ReplayError("record before match header")
+
+            delta, offset = _read_varint(data, offset)
+            tick += delta
+            if tag == TAG_KEYS:
+                count = data[offset]
+                offset += 1
+                keys = []
+                for _ in range(count):
+                    length = data[offset]
+                    keys.append(data[offset + 1:offset + 1 + length].decode("utf-8"))
+                    offset += 1 + length
+                current.inputs.setdefault(tick, []).append(keys)
+            elif tag == TAG_SNAPSHOT:
+                length, offset = _read_varint(data, offset)
+                current.snapshots.append((tick, data[offset:offset + length]))
+                offset += length
+            elif tag == TAG_END:
+                current.end_tick = tick
+            else:
+                raise ReplayError(f"unknown record tag {tag!r}")
+        return replays
+
+    @property
+    def last_tick(self):
+        """Last tick covered by the recording."""
+        if self.end_tick is not None:
+            return self.end_tick
+        ticks = list(self.inputs) + [t for t, _ in self.snapshots]
+        return max(ticks) if ticks else 0
+
+    def prepare(self, game):
+        """Configure and set up a game built like the recorded one."""
+        if game.court is None:
+            game.add(Court(self.width, self.height))
+        elif (game.court.width, game.court.height) != (self.width, self.height):
+            raise ReplayError("court size differs from the recording")
+        game.recorder = None
+        game.set_seed(self.seed).set_tick_rate(self.tick_rate)
+        game.set_win_score(self.win_score).set_headless()
+        game._setup()
+        return game
+
+    def _advance(self, game, start, stop, speed=None, on_tick=None):
+        """Feed recorded input from tick start up to stop."""
+        pace = self.tick_rate / speed if speed else 0.0
+        next_time = time.perf_counter()
+        for tick in range(start, stop):
+            for keys in self.inputs.get(tick, ()):
+                game._handle_input(keys)
+            game._tick()
+            if on_tick:
+                on_tick(game)
+            if pace:
+                next_time += pace
+                delay = next_time - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+        return game
+
+    def play(self, game, speed=None, on_tick=None):
+        """Replay the whole match into a fresh game.
+
+        ``speed`` None runs as fast as possible, 1.0 is real time. The
+        optional ``on_tick(game)`` callback can render or inspect each tick.
+        """
+        self.prepare(game)
+        return self._advance(game, 0, self.last_tick, speed, on_tick)
+
+    def seek(self, game, tick):
+        """Bring a fresh game to the state after ``tick`` ticks.
+
+        Starts from the nearest snapshot at or before the tick, then replays
+        the remaining input.
+        """
+        self.prepare(game)
+        start = 0
+        for snap_tick, data in self.snapshots:
+            if snap_tick > tick:
+                break
+            start = snap_tick
+            snapshot = data
+        if start:
+            game.restore(snapshot)
+        return self._advance(game, start, tick)
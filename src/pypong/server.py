@@ -0,0 +1,370 @@
+import asyncio
+
+from .ball import Ball
+from .court import Court
+from .cpu import CPU
+from .game import Game
+from .paddle import Paddle
+
+
+# Wire protocol (one ASCII line per message)
+#
+#   client -> server   JOIN <match> [cpu-difficulty]   join or create a match
+#                      U / D                           move paddle up / down
+#                      BYE                             leave the match
+#   server -> client   W <side>                        joined as left or right
+#                      <tick> <field>=<value> ...      state delta (changed fields only)
+#                      E <winner>                      match over
+#                      ERR <reason>
+#
+# State fields: bx/by ball, l/r paddle y, sl/sr scores, st status
+# ("w" waiting for players, "c<n>" countdown, "p" playing, "o" over).
+FIELDS = ("bx", "by", "l", "r", "sl", "sr", "st")
+
+
+def encode_delta(tick, state, previous=None):
+    """Encode the fields of state that differ from previous as one line."""
+    parts = [str(tick)]
+    for field in FIELDS:
+        value = state[field]
+        if previous is None or previous.get(field) != value:
+            parts.append(f"{field}={value}")
+    return (" ".join(parts) + "\n").encode("ascii")
+
+
+def decode_delta(line, state):
+    """Apply a delta line to a state dict in place. Returns the tick."""
+    parts = line.split()
+    for part in parts[1:]:
+        field, _, value = part.partition("=")
+        if field in ("sl", "sr"):
+            state[field] = int(value)
+        elif field == "st":
+            state[field] = value
+        else:
+            state[field] = float(value)
+    return int(parts[0])
+
+
+class Match:
+    """One authoritative headless game and its connected players."""
+
+    def __init__(self, match_id, cpu=None, court=None, win_score=7, tick_rate=0.045):
+        self.match_id = match_id
+        self.left = Paddle("left")
+        self.right = CPU("right", difficulty=cpu) if cpu else Paddle("right")
+
+        self.game = Game(title=f"match {match_id}")
+        self.game.add(self.left, self.right, Ball(), court or Court())
+        self.game.set_win_score(win_score).set_tick_rate(tick_rate).set_headless()
+        self.game._setup()
+
+        self.players = {}
+        self.keys = []
+        self.state = None
+        self.finished = False
+
+    def free_side(self):
+        """Return an unclaimed human side, or None if the match is full."""
+        for paddle in (self.left, self.right):
+            if not isinstance(paddle, CPU) and paddle.side not in self.players:
+                return paddle.side
+        return None
+
+    def waiting(self):
+        """True while a human side has no player yet."""
+        return self.free_side() is not None
+
+    def press(self, side, command):
+        """Queue a move for a side's paddle."""
+        paddle = self.left if side == "left" else self.right
+        if command == "U":
+            self.keys.append(paddle.up_key)
+        elif command == "D":
+            self.keys.append(paddle.down_key)
+
+    def snapshot(self):
+        """Current state as a dict of compact wire values."""
+        game = self.game
+        if game.game_over:
+            status = "o"
+        elif self.waiting():
+            status = "w"
+        elif game.countdown > 0:
+            status = f"c{game.countdown}"
+        else:
+            status = "p"
+        return {
+            "bx": round(game.ball.x, 2),
+            "by": round(game.ball.y, 2),
+            "l": round(self.left.y, 2),
+            "r": round(self.right.y, 2),
+            "sl": game.scores["left"],
+            "sr": game.scores["right"],
+            "st": status,
+        }
+
+    def tick(self):
+        """Advance one tick and return (delta, keyframe) lines to broadcast.
+
+        The game is held, countdown included, until every human side has
+        a player.
+        """
+        keys, self.keys = self.keys, []
+        if not self.waiting():
+            self.game.step(keys)
+
+        previous = self.state
+        self.state = self.snapshot()
+        ticks = self.game.ticks
+        delta = encode_delta(ticks, self.state, previous)
+        keyframe = encode_delta(ticks, self.state)
+        self.finished = self.game.game_over
+        return delta, keyframe
+
+
+class Connection:
+    """A player socket with write backpressure.
+
+    Deltas are dropped while the socket's write buffer is above the high
+    water mark; the next send after it drains is a full keyframe so the
+    client resynchronises. Clients past the hard limit are disconnected.
+    """
+
+    def __init__(self, reader, writer, high_water, max_buffer):
+        self.reader = reader
+        self.writer = writer
+        self.high_water = high_water
+        self.max_buffer = max_buffer
+        self.match = None
+        self.side = None
+        self.needs_keyframe = True
+        self.dropped = 0
+
+    def buffered(self):
+        """Bytes waiting in the transport's write buffer."""
+        return self.writer.transport.get_write_buffer_size()
+
+    def send(self, delta, keyframe):
+        """Queue a state update without ever blocking the tick loop."""
+        if self.writer.is_closing():
+            return
+        size = self.buffered()
+        if size > self.max_buffer:
+            self.writer.close()
+            return
+        if size > self.high_water:
+            self.dropped += 1
+            self.needs_keyframe = True
+            return
+        self.writer.write(keyframe if self.needs_keyframe else delta)
+        self.needs_keyframe = False
+
+    def send_line(self, line):
+        if not self.writer.is_closing():
+            self.writer.write(line.encode("ascii") + b"\n")
+
+
+class PongServer:
+    """Hosts many concurrent authoritative matches over TCP.
+
+    A single ticker task steps every match on a fixed timestep and
+    broadcasts state deltas, so adding matches adds no timers or threads.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, tick_rate=0.045, win_score=7,
+                 court=None, high_water=64 * 1024, max_buffer=1024 * 1024,
+                 max_matches=1000):
+        self.host = host
+        self.port = port
+        self.tick_rate = tick_rate
+        self.win_score = win_score
+        self.court = court
+        self.high_water = high_water
+        self.max_buffer = max_buffer
+        self.max_matches = max_matches
+
+        self.matches = {}
+        self.ticks = 0
+        self.max_catchup = 5
+        self._server = None
+        self._ticker = None
+
+    async def start(self):
+        """Start listening and ticking. Returns the bound port."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ticker = asyncio.ensure_future(self._tick_loop())
+        return self.port
+
+    async def close(self):
+        """Stop ticking, close every player socket and the listener."""
+        if self._ticker:
+            self._ticker.cancel()
+            try:
+                await self._ticker
+            except asyncio.CancelledError:
+                pass
+        for match in self.matches.values():
+            for conn in match.players.values():
+                conn.writer.close()
+        self.matches.clear()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def serve_forever(self):
+        await self.start()
+        await self._ticker
+
+    def _join(self, conn, parts):
+        """Handle a JOIN line. Returns an error string or None."""
+        if len(parts) < 2 or parts[0] != "JOIN":
+            return "expected JOIN <match> [cpu]"
+        match_id = parts[1]
+        match = self.matches.get(match_id)
+        if match is None:
+            if len(self.matches) >= self.max_matches:
+                return "server full"
+            cpu = parts[2] if len(parts) > 2 else None
+            court = Court(self.court.width, self.court.height) if self.court else None
+            match = Match(match_id, cpu=cpu, court=court, win_score=self.win_score,
+                          tick_rate=self.tick_rate)
+            self.matches[match_id] = match
+
+        side = match.free_side()
+        if side is None:
+            return "match full"
+        conn.match = match
+        conn.side = side
+        match.players[side] = conn
+        return None
+
+    async def _handle(self, reader, writer):
+        """Serve one player connection."""
+        conn = Connection(reader, writer, self.high_water, self.max_buffer)
+        try:
+            line = await reader.readline()
+            error = self._join(conn, line.decode("ascii", "replace").split())
+            if error:
+                conn.send_line(f"ERR {error}")
+                return
+            conn.send_line(f"W {conn.side}")
+
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line.strip().decode("ascii", "replace")
+                if command == "BYE":
+                    break
+                conn.match.press(conn.side, command)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            match = conn.match
+            if match and match.players.get(conn.side) is conn:
+                del match.players[conn.side]
+                if not match.players and match.match_id in self.matches:
+                    del self.matches[match.match_id]
+            writer.close()
+
+    def _tick_all(self):
+        """Step every match once and broadcast its update."""
+        finished = []
+        for match in list(self.matches.values()):
+            delta, keyframe = match.tick()
+            for conn in list(match.players.values()):
+                conn.send(delta, keyframe)
+            if match.finished:
+                finished.append(match)
+
+        for match in finished:
+            for conn in match.players.values():
+                conn.send_line(f"E {match.game.winner}")
+                conn.writer.close()
+            self.matches.pop(match.match_id, None)
+        self.ticks += 1
+
+    async def _tick_loop(self):
+        """Fixed-timestep scheduler shared by all matches."""
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while True:
+            updates = 0
+            while loop.time() >= next_tick and updates < self.max_catchup:
+                self._tick_all()
+                next_tick += self.tick_rate
+                updates += 1
+            if loop.time() >= next_tick:
+                next_tick = loop.time() + self.tick_rate
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+
+class PongClient:
+    """Minimal client for the server protocol (handy for bots and tests)."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.side = None
+        self.state = {}
+        self.tick = 0
+        self.winner = None
+
+    @classmethod
+    async def connect(cls, host, port, match_id, cpu=None):
+        """Open a connection and join a match."""
+        reader, writer = await asyncio.open_connection(host, port)
+        client = cls(reader, writer)
+        join = f"JOIN {match_id}" + (f" {cpu}" if cpu else "")
+        writer.write(join.encode("ascii") + b"\n")
+        line = (await reader.readline()).decode("ascii").strip()
+        if not line.startswith("W "):
+            writer.close()
+            raise ConnectionError(line or "connection closed")
+        client.side = line[2:]
+        return client
+
+    def move(self, direction):
+        """Send 'U' or 'D'."""
+        self.writer.write(direction.encode("ascii") + b"\n")
+
+    async def read(self):
+        """Read the next message. Returns False once the match is over."""
+        line = await self.reader.readline()
+        if not line:
+            return False
+        text = line.decode("ascii").strip()
+        if text.startswith("E "):
+            self.winner = text[2:]
+            return False
+        self.tick = decode_delta(text, self.state)
+        return True
+
+    def close(self):
+        self.writer.write(b"BYE\n")
+        self.writer.close()
+
+
+def main(argv=None):
+    """Command line entry point: run a match server."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Host Pong matches over TCP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7070)
+    parser.add_argument("--tick-rate", type=float, default=0.045)
+    parser.add_argument("--win-score", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    server = PongServer(args.host, args.port, tick_rate=args.tick_rate,
+                        win_score=args.win_score)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+import math
+import struct
+
+from .cpu import CPU
+
+
+# Fixed binary layout, little endian:
+#   header     magic, version, flags, countdown, winner, paddle count,
+#              ball count, left/right score, ticks, ticks left in the
+#              countdown second
+#   ball       x, y, dx, dy, speed, step carry, frozen, per ball
+#   collision  court_top, court_bottom, min_dy, max_dy
+#   paddle     y, hits, combo, CPU reaction timer (-1 for humans), per paddle
+#   rng        Mersenne Twister state and gauss_next (if FLAG_RNG) for the
+#              game's serve generator, then for each CPU's own generator
+MAGIC = b"PPS1"
+VERSION = 4
+
+HEADER = struct.Struct("<4sBBBbBBHHQI")
+BALL = struct.Struct("<6d?")
+COLLISION = struct.Struct("<4d")
+PADDLE = struct.Struct("<dIIi")
+RNG = struct.Struct("<625Id")
+
+FLAG_RUNNING = 1
+FLAG_PAUSED = 2
+FLAG_GAME_OVER = 4
+FLAG_RNG = 8
+
+WINNERS = {None: -1, "left": 0, "right": 1}
+WINNER_NAMES = {v: k for k, v in WINNERS.items()}
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot does not match the game it is loaded into."""
+
+
+def _nan_if_none(value):
+    return float("nan") if value is None else value
+
+
+def _none_if_nan(value):
+    return None if math.isnan(value) else value
+
+
+def dumps(game, rng=True):
+    """Pack the dynamic state of a set-up game into bytes.
+
+    Configuration (court size, key bindings, CPU presets) is not stored:
+    a snapshot is loaded into a game built the same way. With ``rng`` the
+    serve and CPU generator states are included, so serves and CPU wobble
+    after a restore match the original run exactly.
+    """
+    flags = 0
+    if game.running:
+        flags |= FLAG_RUNNING
+    if game.paused:
+        flags |= FLAG_PAUSED
+    if game.game_over:
+        flags |= FLAG_GAME_OVER
+    if rng:
+        flags |= FLAG_RNG
+
+    parts = [HEADER.pack(
+        MAGIC, VERSION, flags, game.countdown, WINNERS[game.winner],
+        len(game.paddles), len(game.balls),
+        game.scores.get("left", 0), game.scores.get("right", 0),
+        game.ticks, game.countdown_ticks,
+    )]
+
+    for ball in game.balls:
+        parts.append(BALL.pack(ball.x, ball.y, ball.dx, ball.dy, ball.speed,
+                               ball._accum, ball.frozen))
+
+    c = game.collision
+    parts.append(COLLISION.pack(c.court_top, _nan_if_none(c.court_bottom), c.min_dy, c.max_dy))
+
+    for paddle in game.paddles:
+        timer = paddle._reaction_timer if isinstance(paddle, CPU) else -1
+        parts.append(PADDLE.pack(paddle.y, paddle.hits, paddle.combo, timer))
+
+    if rng:
+        for generator in [game.rng] + [cpu.rng for cpu in game.cpus]:
+            _, mt, gauss = generator.getstate()
+            parts.append(RNG.pack(*mt, _nan_if_none(gauss)))
+
+    return b"".join(parts)
+
+
+def loads(game, data):
+    """Restore state produced by ``dumps`` into an identically built game."""
+    view = memoryview(data)
+    (magic, version, flags, countdown, winner, count, balls, left, right,
+     ticks, countdown_ticks) = HEADER.unpack_from(view, 0)
+    if magic != MAGIC or version != VERSION:
+        raise SnapshotError("not a pypong snapshot")
+    if count != len(game.paddles):
+        raise SnapshotError(f"snapshot has {count} paddles, game has {len(game.paddles)}")
+    if balls != len(game.balls):
+        raise SnapshotError(f"snapshot has {balls} balls, game has {len(game.balls)}")
+    offset = HEADER.size
+
+    game.running = bool(flags & FLAG_RUNNING)
+    game.paused = bool(flags & FLAG_PAUSED)
+    game.game_over = bool(flags & FLAG_GAME_OVER)
+    game.countdown = countdown
+    game.winner = WINNER_NAMES[winner]
+    game.scores["left"] = left
+    game.scores["right"] = right
+    game.ticks = ticks
+    game.countdown_ticks = countdown_ticks
+
+    for ball in game.balls:
+        (ball.x, ball.y, ball.dx, ball.dy, ball.speed, ball._accum,
+         ball.frozen) = BALL.unpack_from(view, offset)
+        offset += BALL.size
+
+    c = game.collision
+    c.court_top, bottom, c.min_dy, c.max_dy = COLLISION.unpack_from(view, offset)
+    c.court_bottom = _none_if_nan(bottom)
+    offset += COLLISION.size
+
+    for paddle in game.paddles:
+        paddle.y, paddle.hits, paddle.combo, reaction = PADDLE.unpack_from(view, offset)
+        if isinstance(paddle, CPU):
+            paddle._reaction_timer = reaction
+            paddle._predicted_for = None
+        offset += PADDLE.size
+
+    if flags & FLAG_RNG:
+        for generator in [game.rng] + [cpu.rng for cpu in game.cpus]:
+            values = RNG.unpack_from(view, offset)
+            generator.setstate((3, tuple(values[:625]), _none_if_nan(values[625])))
+            offset += RNG.size
+
+    return offset
+
+
+def size(game, rng=True):
+    """Size in bytes of a snapshot of this game."""
+    total = (HEADER.size + BALL.size * len(game.balls) + COLLISION.size
+             + PADDLE.size * len(game.paddles))
+    if rng:
+        total += RNG.size * (1 + len(game.cpus))
+    return total
@@ -0,0 +1,50 @@
+from bisect import bisect_left, bisect_right
+
+
+class PaddleIndex:
+    """Paddles bucketed by the column of their hitting face.
+
+    Paddles only ever move vertically, so the index is built once per
+    court. A ball sweeping from one column to another asks only for the
+    faces inside that span instead of testing every paddle on the court.
+    """
+
+    __slots__ = ("paddles", "_left_faces", "_left", "_right_faces", "_right")
+
+    def __init__(self, paddles=()):
+        self.rebuild(paddles)
+
+    def rebuild(self, paddles):
+        """Index paddles after their columns are known (after setup)."""
+        self.paddles = list(paddles)
+        left = sorted((p.x + 1, i) for i, p in enumerate(self.paddles) if p.side == "left")
+        right = sorted((p.x - 1, i) for i, p in enumerate(self.paddles) if p.side == "right")
+        self._left_faces = [face for face, _ in left]
+        self._left = [self.paddles[i] for _, i in left]
+        self._right_faces = [face for face, _ in right]
+        self._right = [self.paddles[i] for _, i in right]
+        return self
+
+    def facing(self, dx, x_from, x_to):
+        """Paddles whose face a ball moving by dx meets between two columns.
+
+        Left paddles return balls moving left and right paddles balls
+        moving right; faces behind the ball's start are skipped.
+        """
+        if dx < 0:
+            faces, paddles = self._left_faces, self._left
+            lo = bisect_left(faces, x_to)
+            hi = bisect_right(faces, x_from)
+        elif dx > 0:
+            faces, paddles = self._right_faces, self._right
+            lo = bisect_left(faces, x_from)
+            hi = bisect_right(faces, x_to)
+        else:
+            return []
+        return paddles[lo:hi]
+
+    def __iter__(self):
+        return iter(self.paddles)
+
+    def __len__(self):
+        return len(self.paddles)
@@ -0,0 +1,230 @@
+import os
+import socket
+import sys
+
+from .renderer import Renderer
+
+
+class Viewer:
+    """One spectator fd (pipe or Unix socket) written without blocking.
+
+    A frame the kernel only partly accepts is kept and finished before
+    anything else is sent, so escape sequences are never cut. While a
+    viewer is still catching up, new frames are dropped for it and its
+    next frame is a full keyframe.
+    """
+
+    def __init__(self, fd, owner=None):
+        self.fd = fd
+        # Socket object (if any) that owns the fd and keeps it open
+        self.owner = owner
+        os.set_blocking(fd, False)
+        self.pending = None
+        self.needs_keyframe = True
+        self.closed = False
+
+        # Stats
+        self.frames = 0
+        self.dropped = 0
+        self.bytes_written = 0
+
+    def _write(self, data):
+        """Write what the fd takes now. Returns the unsent tail or None."""
+        try:
+            written = os.write(self.fd, data)
+        except BlockingIOError:
+            written = 0
+        except OSError:
+            self.close()
+            return None
+        self.bytes_written += written
+        if written < len(data):
+            return memoryview(data)[written:]
+        return None
+
+    def catch_up(self):
+        """Try to finish a partly sent frame. Returns True when idle."""
+        if self.pending is not None:
+            self.pending = self._write(self.pending)
+        return self.pending is None and not self.closed
+
+    def send(self, data):
+        """Send a frame to an idle viewer."""
+        self.pending = self._write(data)
+        self.frames += 1
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        self.pending = None
+        if self.owner is not None:
+            self.owner.close()
+        else:
+            os.close(self.fd)
+
+
+class SpectatorHub:
+    """Broadcasts a game to many local viewers at the cost of one.
+
+    Each tick the frame is built and diff-encoded once, and the same
+    bytes are written to every viewer; a full keyframe is encoded at most
+    once per tick, only when some viewer needs one. Attach with
+    ``Game.set_spectators``. Viewers connect to the Unix socket at
+    ``path`` or are added directly as fds with ``add``.
+    """
+
+    def __init__(self, path=None, max_viewers=256):
+        self.path = path
+        self.max_viewers = max_viewers
+        self.renderer = Renderer()
+        self.viewers = []
+        self._listener = None
+        self._game = None
+
+        # Stats
+        self.frames = 0
+        self.keyframes = 0
+        self.dropped = 0
+
+        if path:
+            self.listen(path)
+
+    def listen(self, path):
+        """Accept viewers on a Unix socket at path."""
+        if os.path.exists(path):
+            os.unlink(path)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(path)
+        listener.listen(16)
+        listener.setblocking(False)
+        self._listener = listener
+        self.path = path
+        return self
+
+    def add(self, fd, owner=None):
+        """Add a viewer writing to fd (e.g. the write end of a pipe)."""
+        viewer = Viewer(fd, owner)
+        self.viewers.append(viewer)
+        return viewer
+
+    def _accept(self):
+        while len(self.viewers) < self.max_viewers:
+            try:
+                conn, _ = self._listener.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            conn.shutdown(socket.SHUT_RD)
+            self.add(conn.fileno(), owner=conn)
+
+    def after_tick(self, game):
+        """Broadcast the game's frame. Called by Game after every tick."""
+        if game is not self._game:
+            self._game = game
+            self.renderer.invalidate()
+            for viewer in self.viewers:
+                viewer.needs_keyframe = True
+        if self._listener is not None:
+            self._accept()
+        if not self.viewers:
+            # Nobody watching: skip the frame and start fresh later
+            self.renderer.invalidate()
+            return
+
+        frame = game.frame()
+        self.broadcast(frame, self.renderer.encode(frame))
+
+    def broadcast(self, frame, delta):
+        """Send delta (or one shared keyframe of frame) to every viewer."""
+        self.frames += 1
+        keyframe = None
+        for viewer in self.viewers:
+            if not viewer.catch_up():
+                # Still writing an old frame: skip this one
+                if not viewer.closed:
+                    viewer.dropped += 1
+                    self.dropped += 1
+                    viewer.needs_keyframe = True
+                continue
+            if viewer.needs_keyframe:
+                if keyframe is None:
+                    keyframe = self.renderer.keyframe(frame)
+                    self.keyframes += 1
+                viewer.needs_keyframe = False
+                viewer.send(keyframe)
+            elif delta:
+                viewer.send(delta)
+
+        if any(viewer.closed for viewer in self.viewers):
+            self.viewers = [viewer for viewer in self.viewers if not viewer.closed]
+
+    def close(self):
+        """Disconnect every viewer and remove the socket."""
+        for viewer in self.viewers:
+            viewer.close()
+        self.viewers = []
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+            if self.path and os.path.exists(self.path):
+                os.unlink(self.path)
+
+
+def watch(path, out=None):
+    """Connect to a spectator socket and copy the match to a terminal fd."""
+    out = sys.stdout.fileno() if out is None else out
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.connect(path)
+    os.write(out, b"\033[?25l")
+    try:
+        while True:
+            data = conn.recv(65536)
+            if not data:
+                break
+            view = memoryview(data)
+            while view:
+                view = view[os.write(out, view):]
+    except KeyboardInterrupt:
+        pass
+    finally:
+        conn.close()
+        os.write(out, b"\033[?25h\n")
+
+
+def main(argv=None):
+    """Command line entry point: host a CPU match for spectators, or watch one."""
+    import argparse
+    import asyncio
+
+    from .ball import Ball
+    from .court import Court
+    from .cpu import CPU
+    from .game import Game
+
+    parser = argparse.ArgumentParser(description="Stream a Pong match to local spectators.")
+    parser.add_argument("path", help="Unix socket path")
+    parser.add_argument("--watch", action="store_true", help="watch instead of hosting")
+    parser.add_argument("--left", default="hard")
+    parser.add_argument("--right", default="medium")
+    parser.add_argument("--win-score", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    if args.watch:
+        watch(args.path)
+        return
+
+    hub = SpectatorHub(args.path)
+    game = Game(title="spectator match")
+    game.add(CPU("left", difficulty=args.left), CPU("right", difficulty=args.right),
+             Ball(), Court())
+    game.set_win_score(args.win_score).set_sound(False).set_spectators(hub)
+    try:
+        asyncio.run(game.run_async(exit_on_game_over=True))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        hub.close()
+
+
+if __name__ == "__main__":
+    main()
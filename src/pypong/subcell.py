@@ -0,0 +1,88 @@
+# Sub-cell layouts: (dot columns, dot rows) packed into one terminal cell
+MODES = {
+    "half": (1, 2),
+    "braille": (2, 4),
+}
+
+HALF_CHARS = (" ", "▀", "▄", "█")
+
+# Braille dot bits by (column, row), per the Unicode braille pattern block
+BRAILLE_BITS = ((0x01, 0x02, 0x04, 0x40), (0x08, 0x10, 0x20, 0x80))
+
+
+class SubCellCanvas:
+    """Dot layer that packs sub-cell positions into half-block or braille cells.
+
+    Objects add dots at float court coordinates; each cell keeps a bitmask
+    of its lit dots and ``stamp`` turns the touched cells into characters
+    on a FrameBuffer. Vertical runs are composed a whole cell at a time
+    from precomputed masks, never dot by dot.
+    """
+
+    def __init__(self, width, height, mode="braille"):
+        self.width = width
+        self.height = height
+        self.mode = mode
+        self.cols, self.rows = MODES[mode]
+
+        if mode == "half":
+            bits = ((1, 2),)
+            self._chars = HALF_CHARS
+        else:
+            bits = BRAILLE_BITS
+            self._chars = tuple(chr(0x2800 + mask) for mask in range(256))
+        self._bits = bits
+
+        # _runs[start][end]: mask of dot rows start..end-1 across all columns
+        rows = self.rows
+        self._runs = [[0] * (rows + 1) for _ in range(rows + 1)]
+        for start in range(rows):
+            mask = 0
+            for end in range(start + 1, rows + 1):
+                for column in bits:
+                    mask |= column[end - 1]
+                self._runs[start][end] = mask
+        self._full = self._runs[0][rows]
+
+        self._masks = [0] * (width * height)
+        self._touched = []
+
+    def matches(self, court, mode):
+        """True if this canvas fits the court size and render mode."""
+        return court.width == self.width and court.height == self.height and mode == self.mode
+
+    def _add(self, cx, cy, mask):
+        if 0 <= cx < self.width and 0 <= cy < self.height:
+            i = cy * self.width + cx
+            if not self._masks[i]:
+                self._touched.append(i)
+            self._masks[i] |= mask
+
+    def dot(self, x, y):
+        """Light the dot nearest to a float court position."""
+        dx = int((x + 0.5) * self.cols)
+        dy = int((y + 0.5) * self.rows)
+        self._add(dx // self.cols, dy // self.rows, self._bits[dx % self.cols][dy % self.rows])
+
+    def vline(self, x, y, length):
+        """Fill cell column x from float row y down for length cells."""
+        rows = self.rows
+        top = int(y * rows)
+        bottom = top + length * rows
+        cy = top // rows
+        while cy * rows < bottom:
+            start = max(top - cy * rows, 0)
+            end = min(bottom - cy * rows, rows)
+            mask = self._full if start == 0 and end == rows else self._runs[start][end]
+            self._add(x, cy, mask)
+            cy += 1
+
+    def stamp(self, fb):
+        """Draw the lit cells onto a FrameBuffer and clear the canvas."""
+        masks = self._masks
+        chars = self._chars
+        width = self.width
+        for i in self._touched:
+            fb.stamp(i % width, i // width, chars[masks[i]])
+            masks[i] = 0
+        self._touched = []
@@ -0,0 +1,205 @@
+import collections
+import json
+import queue
+import threading
+
+# Columns recorded for every event
+COLUMNS = ("match", "tick", "kind", "side", "speed", "combo", "rally", "x", "y")
+
+KINDS = ("hit", "bounce", "score", "rally", "over")
+
+
+class Aggregates:
+    """Rolling match statistics kept in constant memory."""
+
+    def __init__(self, rally_buckets=32, speed_step=0.25, speed_buckets=16, window=100):
+        self.counts = dict.fromkeys(KINDS, 0)
+        self.points = {"left": 0, "right": 0}
+        self.matches = 0
+
+        # Rally lengths 0..rally_buckets-2, the last bucket holds longer ones
+        self.rally_histogram = [0] * rally_buckets
+        self.longest_rally = 0
+        self.recent_rallies = collections.deque(maxlen=window)
+
+        # Ball speed when a point is scored
+        self.speed_step = speed_step
+        self.speed_histogram = [0] * speed_buckets
+        self.speed_total = 0.0
+        self.speed_max = 0.0
+
+    def add_rally(self, length):
+        last = len(self.rally_histogram) - 1
+        self.rally_histogram[min(length, last)] += 1
+        self.longest_rally = max(self.longest_rally, length)
+        self.recent_rallies.append(length)
+
+    def add_score(self, side, speed):
+        self.points[side] = self.points.get(side, 0) + 1
+        bucket = min(int(speed / self.speed_step), len(self.speed_histogram) - 1)
+        self.speed_histogram[bucket] += 1
+        self.speed_total += speed
+        self.speed_max = max(self.speed_max, speed)
+
+    def summary(self):
+        """Plain dict of the aggregates."""
+        scored = self.counts["score"]
+        recent = self.recent_rallies
+        return {
+            "matches": self.matches,
+            "counts": dict(self.counts),
+            "points": dict(self.points),
+            "rally_histogram": list(self.rally_histogram),
+            "longest_rally": self.longest_rally,
+            "recent_avg_rally": sum(recent) / len(recent) if recent else 0.0,
+            "speed_histogram": list(self.speed_histogram),
+            "avg_score_speed": self.speed_total / scored if scored else 0.0,
+            "max_score_speed": self.speed_max,
+        }
+
+
+class Telemetry:
+    """Streams match events to a file and keeps rolling aggregates.
+
+    Attach with ``Game.set_telemetry``. Every hit, wall bounce, point,
+    finished rally and game over is appended to in-memory columns; each
+    ``batch_size`` events the batch is handed to a background thread that
+    encodes and writes it, so the game loop never waits on the disk.
+    ``columnar`` writes one JSON object of column arrays per batch,
+    otherwise one JSON object per event (NDJSON). With no ``target`` only
+    the aggregates are kept. Batches are dropped, and counted, if the
+    writer falls ``max_pending`` batches behind. A write error stops the
+    output and is kept in ``error``; the game carries on.
+    """
+
+    def __init__(self, target=None, batch_size=4096, columnar=True, max_pending=64):
+        self.batch_size = batch_size
+        self.columnar = columnar
+        self.aggregates = Aggregates()
+        self.match = -1
+        self.dropped_batches = 0
+        self._rally = 0
+        self._columns = self._new_columns()
+        self._count = 0
+
+        self._file = None
+        self._owns_file = False
+        self._queue = None
+        self._thread = None
+        self.error = None
+        if target is not None:
+            if isinstance(target, str):
+                self._file = open(target, "a", encoding="utf-8")
+                self._owns_file = True
+            else:
+                self._file = target
+            self._queue = queue.Queue(maxsize=max_pending)
+            self._thread = threading.Thread(target=self._writer, name="pypong-telemetry",
+                                            daemon=True)
+            self._thread.start()
+
+    def _new_columns(self):
+        return {name: [] for name in COLUMNS}
+
+    def _record(self, kind, tick, side=None, speed=0.0, combo=0, rally=0, x=0.0, y=0.0):
+        columns = self._columns
+        columns["match"].append(self.match)
+        columns["tick"].append(tick)
+        columns["kind"].append(kind)
+        columns["side"].append(side)
+        columns["speed"].append(round(speed, 4))
+        columns["combo"].append(combo)
+        columns["rally"].append(rally)
+        columns["x"].append(round(x, 3))
+        columns["y"].append(round(y, 3))
+        self.aggregates.counts[kind] += 1
+        self._count += 1
+        if self._count >= self.batch_size:
+            self.flush()
+
+    def begin(self, game):
+        """Start a new match. Called by Game on setup and restart."""
+        self.match += 1
+        self.aggregates.matches += 1
+        self._rally = 0
+
+    def hit(self, game, paddle, ball):
+        self._rally += 1
+        self._record("hit", game.ticks, paddle.side, ball.speed, paddle.combo,
+                     self._rally, ball.x, ball.y)
+
+    def bounce(self, game, ball):
+        self._record("bounce", game.ticks, None, ball.speed, 0, self._rally, ball.x, ball.y)
+
+    def score(self, game, side, ball):
+        """A point for side; also closes the rally."""
+        self.aggregates.add_score(side, ball.speed)
+        self.aggregates.add_rally(self._rally)
+        self._record("score", game.ticks, side, ball.speed, 0, self._rally, ball.x, ball.y)
+        self._record("rally", game.ticks, side, ball.speed, 0, self._rally, ball.x, ball.y)
+        self._rally = 0
+
+    def game_over(self, game):
+        self._record("over", game.ticks, game.winner)
+
+    def flush(self, block=False):
+        """Hand the current batch to the writer thread.
+
+        A full queue drops the batch, unless ``block`` waits for room.
+        """
+        if not self._count:
+            return
+        batch, self._columns, self._count = self._columns, self._new_columns(), 0
+        if self._queue is None:
+            return
+        if block:
+            self._queue.put(batch)
+            return
+        try:
+            self._queue.put_nowait(batch)
+        except queue.Full:
+            self.dropped_batches += 1
+
+    def _encode(self, batch):
+        if self.columnar:
+            return json.dumps(batch, separators=(",", ":")) + "\n"
+        lines = []
+        for row in zip(*(batch[name] for name in COLUMNS)):
+            lines.append(json.dumps(dict(zip(COLUMNS, row)), separators=(",", ":")))
+        return "\n".join(lines) + "\n"
+
+    def _writer(self):
+        """Background thread: encode and write batches until told to stop."""
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                break
+            if self.error is not None:
+                continue
+            try:
+                self._file.write(self._encode(batch))
+                if self._queue.empty():
+                    self._file.flush()
+            except (OSError, ValueError) as error:
+                # Keep draining so the game never blocks on a dead file
+                self.error = error
+
+    def close(self):
+        """Write what is left and stop the writer thread."""
+        self.flush(block=True)
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+            self._queue = None
+            try:
+                if self._owns_file:
+                    self._file.close()
+                elif self.error is None:
+                    self._file.flush()
+            except (OSError, ValueError) as error:
+                self.error = self.error or error
+
+    def summary(self):
+        """Aggregates as a plain dict."""
+        return self.aggregates.summary()
@@ -0,0 +1,97 @@
+from .cpu import CPU
+
+
+class FrameTemplate:
+    """Cached text around the playing field.
+
+    The score header, borders, controls line, status line and padding
+    only change with the court, the paddle set, the score or the game
+    state, so each part is rebuilt only when its inputs change. ``head``
+    and ``tail`` hold the lines above and below the field.
+    """
+
+    def __init__(self):
+        self.head = []
+        self.tail = []
+        self.invalidate()
+
+    def invalidate(self):
+        """Rebuild every part on the next update."""
+        self._court_key = None
+        self._paddles_key = None
+        self._score_key = None
+        self._status_key = None
+
+    def _build_names(self, paddles):
+        """Player names and the controls line for a paddle set."""
+        self.left_name = "P1"
+        self.right_name = "P2"
+        control_parts = []
+        for paddle in paddles:
+            if isinstance(paddle, CPU):
+                if paddle.side == "left":
+                    self.left_name = "CPU"
+                else:
+                    self.right_name = "CPU"
+            elif paddle.up_key and paddle.down_key:
+                name = "P1" if paddle.side == "left" else "P2"
+                control_parts.append(f"{paddle.up_key.upper()}/{paddle.down_key.upper()}:{name}")
+        control_parts.extend(["P:Pause", "Q:Quit", "R:Restart"])
+        self.controls = "  " + "  ".join(control_parts)
+
+    def _build_header(self, width, left_score, right_score):
+        header = f"  {self.left_name} [{left_score}]"
+        header2 = f"[{right_score}] {self.right_name}"
+        gap = width + 2 - len(header) - len(header2)
+        return header + " " * max(gap, 1) + header2
+
+    def _build_status(self, game):
+        """Status message; always one line, so the frame height never changes."""
+        if game.countdown > 0:
+            return f"          >>> Get ready... {game.countdown} <<<"
+        if game.paused:
+            return f"          >>> PAUSED - Press P to resume <<<"
+        if game.game_over:
+            winner_name = self.left_name if game.winner == "left" else self.right_name
+            return f"          >>> {winner_name} WINS! R:Restart Q:Quit <<<"
+        return ""
+
+    def update(self, game):
+        """Bring the cached lines up to date with the game. Returns self."""
+        court = game.court
+        court_key = (court, court.key())
+        paddles_key = tuple(game.paddles)
+        score_key = (game.scores.get("left", 0), game.scores.get("right", 0))
+        status_key = (game.countdown, game.paused, game.game_over, game.winner)
+
+        rebuild = False
+        if court_key != self._court_key:
+            self._court_key = court_key
+            self.top_border = court.top_border()
+            self.bottom_border = court.bottom_border()
+            self.padding = " " * (court.width + 2)
+            self._score_key = None
+            rebuild = True
+
+        if paddles_key != self._paddles_key:
+            self._paddles_key = paddles_key
+            self._build_names(game.paddles)
+            self._score_key = None
+            self._status_key = None
+            rebuild = True
+
+        if score_key != self._score_key:
+            self._score_key = score_key
+            self.header = self._build_header(court.width, *score_key)
+            rebuild = True
+
+        if status_key != self._status_key:
+            self._status_key = status_key
+            self.status = self._build_status(game)
+            rebuild = True
+
+        if rebuild:
+            self.head = [self.header, "", self.top_border]
+            self.tail = [self.bottom_border, self.controls, "", self.status,
+                         self.padding, self.padding, self.padding]
+        return self
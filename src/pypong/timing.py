@@ -0,0 +1,58 @@
+class FrameStats:
+    """Timing stats for the game loop: update, build and write times per frame."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Clear all counters."""
+        self.frames = 0
+        self.ticks = 0
+        self.dropped_frames = 0
+
+        # Last frame
+        self.update_time = 0.0
+        self.build_time = 0.0
+        self.write_time = 0.0
+        self.frame_time = 0.0
+
+        # Totals and worst case
+        self.total_update = 0.0
+        self.total_build = 0.0
+        self.total_write = 0.0
+        self.max_frame_time = 0.0
+
+    def record_ticks(self, count, elapsed):
+        """Record simulation ticks run this frame and the time they took."""
+        self.ticks += count
+        self.update_time = elapsed
+        self.total_update += elapsed
+
+    def record_frame(self, build, write):
+        """Record a rendered frame."""
+        self.frames += 1
+        self.build_time = build
+        self.write_time = write
+        self.total_build += build
+        self.total_write += write
+        self.frame_time = self.update_time + build + write
+        if self.frame_time > self.max_frame_time:
+            self.max_frame_time = self.frame_time
+
+    def record_drop(self):
+        """Record a render skipped to catch up with the simulation."""
+        self.dropped_frames += 1
+
+    def summary(self):
+        """Return averages in milliseconds and counters as a dict."""
+        frames = max(self.frames, 1)
+        loops = max(self.frames + self.dropped_frames, 1)
+        return {
+            "frames": self.frames,
+            "ticks": self.ticks,
+            "dropped_frames": self.dropped_frames,
+            "avg_update_ms": self.total_update / loops * 1000,
+            "avg_build_ms": self.total_build / frames * 1000,
+            "avg_write_ms": self.total_write / frames * 1000,
+            "max_frame_ms": self.max_frame_time * 1000,
+        }
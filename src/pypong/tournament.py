@@ -0,0 +1,259 @@
+import argparse
+import csv
+import itertools
+import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .ball import Ball
+from .court import Court
+from .cpu import CPU
+from .game import Game
+
+
+RESULT_FIELDS = [
+    "round", "match", "seed", "left", "right", "winner", "left_score",
+    "right_score", "left_hits", "right_hits", "rallies", "avg_rally", "ticks",
+]
+
+
+def _make_cpu(side, entrant):
+    """Build a CPU paddle from an entrant spec."""
+    cpu = CPU(side, height=entrant.get("height", 5),
+              difficulty=entrant.get("difficulty", "medium"))
+    overrides = entrant.get("config")
+    if overrides:
+        configs = dict(cpu._configs)
+        base = configs.get(cpu.difficulty, configs["medium"])
+        configs[cpu.difficulty] = dict(base, **overrides)
+        cpu._configs = configs
+    return cpu
+
+
+def play_match(left, right, seed, width=60, height=22, win_score=7,
+               max_ticks=200000):
+    """Play one headless CPU-vs-CPU match and return its result dict.
+
+    ``left`` and ``right`` are ``(name, spec)`` pairs where spec holds CPU
+    keyword arguments and an optional ``config`` dict of preset overrides.
+    The same seed always reproduces the same match.
+    """
+    left_name, left_spec = left
+    right_name, right_spec = right
+
+    left_cpu = _make_cpu("left", left_spec)
+    right_cpu = _make_cpu("right", right_spec)
+
+    game = Game()
+    game.add(left_cpu, right_cpu, Ball(), Court(width=width, height=height))
+    game.set_win_score(win_score).set_sound(False).set_headless().set_seed(seed)
+
+    rallies = []
+    rally = [0]
+
+    def on_hit(paddle, ball):
+        rally[0] += 1
+
+    def on_score(side, scores):
+        rallies.append(rally[0])
+        rally[0] = 0
+
+    game.on_hit = on_hit
+    game.on_score = on_score
+
+    while not game.game_over and game.ticks < max_ticks:
+        game.step()
+
+    return {
+        "seed": seed,
+        "left": left_name,
+        "right": right_name,
+        "winner": {"left": left_name, "right": right_name}.get(game.winner, ""),
+        "left_score": game.scores["left"],
+        "right_score": game.scores["right"],
+        "left_hits": left_cpu.hits,
+        "right_hits": right_cpu.hits,
+        "rallies": len(rallies),
+        "avg_rally": sum(rallies) / len(rallies) if rallies else 0.0,
+        "ticks": game.ticks,
+    }
+
+
+def _play(args):
+    """Process pool entry point."""
+    left, right, seed, options = args
+    return play_match(left, right, seed, **options)
+
+
+class ResultWriter:
+    """Streams match results to a JSONL or CSV file as they finish."""
+
+    def __init__(self, path):
+        self.path = path
+        self.csv = path.endswith(".csv")
+        self._file = open(path, "w", newline="")
+        self._writer = None
+        if self.csv:
+            self._writer = csv.DictWriter(self._file, fieldnames=RESULT_FIELDS)
+            self._writer.writeheader()
+
+    def write(self, result):
+        """Append one result and flush it to disk."""
+        if self.csv:
+            self._writer.writerow(result)
+        else:
+            self._file.write(json.dumps(result) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class Tournament:
+    """Round-robin or bracket tournament between CPU entrants.
+
+    Entrants map a name to CPU keyword arguments, e.g.
+    ``{"hard": {"difficulty": "hard"}, "twitchy": {"difficulty": "easy",
+    "config": {"react_every": 2}}}``. Every match gets a fixed seed derived
+    from the tournament seed, so any result can be replayed with
+    ``play_match``.
+    """
+
+    def __init__(self, entrants, mode="round_robin", games_per_pair=10,
+                 seed=0, workers=None, **match_options):
+        if mode not in ("round_robin", "bracket"):
+            raise ValueError(f"Unknown tournament mode: {mode}")
+        self.entrants = dict(entrants)
+        self.mode = mode
+        self.games_per_pair = games_per_pair
+        self.seed = seed
+        self.workers = workers
+        self.match_options = match_options
+        self.results = []
+        self.champion = None
+        self._match_id = 0
+
+    def _jobs(self, pairs, round_no):
+        """Build (job, meta) pairs for every game between the given pairs."""
+        jobs = []
+        for a, b in pairs:
+            for i in range(self.games_per_pair):
+                # Alternate sides so neither entrant always serves left
+                left, right = (a, b) if i % 2 == 0 else (b, a)
+                seed = self.seed * 1000003 + self._match_id
+                meta = {"round": round_no, "match": self._match_id}
+                self._match_id += 1
+                job = ((left, self.entrants[left]), (right, self.entrants[right]),
+                       seed, self.match_options)
+                jobs.append((job, meta))
+        return jobs
+
+    def _play_round(self, pool, pairs, round_no, writer):
+        """Play a round in the pool, streaming results as they finish."""
+        futures = {}
+        for job, meta in self._jobs(pairs, round_no):
+            futures[pool.submit(_play, job)] = meta
+
+        finished = []
+        for future in as_completed(futures):
+            result = dict(futures[future], **future.result())
+            finished.append(result)
+            self.results.append(result)
+            if writer:
+                writer.write(result)
+        return finished
+
+    def run(self, output=None):
+        """Play the tournament. Results stream to ``output`` if given."""
+        writer = ResultWriter(output) if output else None
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                if self.mode == "round_robin":
+                    pairs = list(itertools.combinations(self.entrants, 2))
+                    self._play_round(pool, pairs, 0, writer)
+                else:
+                    self._run_bracket(pool, writer)
+        finally:
+            if writer:
+                writer.close()
+        return self.summary()
+
+    def _run_bracket(self, pool, writer):
+        """Single elimination; the entrant with more wins in a pair advances."""
+        alive = list(self.entrants)
+        round_no = 0
+        while len(alive) > 1:
+            pairs = list(zip(alive[0::2], alive[1::2]))
+            bye = alive[-1:] if len(alive) % 2 else []
+            results = self._play_round(pool, pairs, round_no, writer)
+
+            alive = []
+            for a, b in pairs:
+                wins_a = sum(1 for r in results if r["winner"] == a)
+                wins_b = sum(1 for r in results if r["winner"] == b)
+                alive.append(a if wins_a >= wins_b else b)
+            alive.extend(bye)
+            round_no += 1
+        self.champion = alive[0] if alive else None
+
+    def summary(self):
+        """Aggregate win rates, rally lengths and hits per matchup."""
+        matchups = {}
+        for r in self.results:
+            a, b = sorted((r["left"], r["right"]))
+            stats = matchups.setdefault((a, b), {
+                "games": 0, "wins": {a: 0, b: 0}, "draws": 0,
+                "hits": {a: 0, b: 0}, "rally_total": 0.0, "rallies": 0,
+            })
+            stats["games"] += 1
+            if r["winner"]:
+                stats["wins"][r["winner"]] += 1
+            else:
+                stats["draws"] += 1
+            stats["hits"][r["left"]] += r["left_hits"]
+            stats["hits"][r["right"]] += r["right_hits"]
+            stats["rally_total"] += r["avg_rally"] * r["rallies"]
+            stats["rallies"] += r["rallies"]
+
+        summary = {}
+        for (a, b), stats in matchups.items():
+            games = stats["games"]
+            summary[f"{a} vs {b}"] = {
+                "games": games,
+                "win_rate": {name: wins / games for name, wins in stats["wins"].items()},
+                "draws": stats["draws"],
+                "avg_hits": {name: hits / games for name, hits in stats["hits"].items()},
+                "avg_rally": (stats["rally_total"] / stats["rallies"]
+                              if stats["rallies"] else 0.0),
+            }
+        return summary
+
+
+def main(argv=None):
+    """Command line entry point: pit the CPU presets against each other."""
+    parser = argparse.ArgumentParser(description="Run a CPU-vs-CPU Pong tournament.")
+    parser.add_argument("difficulties", nargs="*", default=["easy", "medium", "hard"])
+    parser.add_argument("--mode", choices=["round_robin", "bracket"], default="round_robin")
+    parser.add_argument("--games", type=int, default=10, help="games per pairing")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--win-score", type=int, default=7)
+    parser.add_argument("--max-ticks", type=int, default=200000)
+    parser.add_argument("--output", "-o", default=None, help="results .jsonl or .csv")
+    args = parser.parse_args(argv)
+
+    entrants = {d: {"difficulty": d} for d in args.difficulties}
+    tournament = Tournament(entrants, mode=args.mode, games_per_pair=args.games,
+                            seed=args.seed, workers=args.workers,
+                            win_score=args.win_score, max_ticks=args.max_ticks)
+    summary = tournament.run(args.output)
+
+    for matchup, stats in summary.items():
+        rates = "  ".join(f"{name} {rate:.0%}" for name, rate in stats["win_rate"].items())
+        print(f"  {matchup}: {rates}  draws {stats['draws']}  "
+              f"avg rally {stats['avg_rally']:.1f}  ({stats['games']} games)")
+    if args.mode == "bracket":
+        print(f"  Champion: {tournament.champion}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+import pytest
+
+from pypong import Ball
+
+
+@pytest.mark.parametrize("speed", [0.4, 1.0, 1.72, 37.5])
+def test_advance_ends_where_update_does(speed):
+    stepped = Ball(speed=speed)
+    jumped = Ball(speed=speed)
+    for ball in (stepped, jumped):
+        ball.dx, ball.dy = -1.0, 0.35
+
+    for _ in range(50):
+        count = sum(1 for _ in stepped.update(0.045))
+        assert jumped.advance(0.045) == count
+        assert jumped.x == stepped.x
+        assert jumped.y == pytest.approx(stepped.y)
+        assert jumped._accum == stepped._accum
+
+
+def test_frozen_ball_does_not_advance():
+    ball = Ball(speed=3.0)
+    ball.dx = 1.0
+    ball.frozen = True
+    assert ball.advance(0.045) == 0
+    assert ball.x == 0.0
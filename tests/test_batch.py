@@ -0,0 +1,84 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pypong import Ball, CPU, Court, Game, Paddle
+from pypong.batch import BatchEngine
+from pypong.collision import CollisionHandler
+
+
+def player(side, difficulty):
+    """A CPU, or an idle human paddle for difficulty None."""
+    if difficulty is None:
+        return Paddle(side)
+    return CPU(side, difficulty=difficulty)
+
+
+def build(left, right, seed):
+    """A headless substep-collision game and a one-match engine, same serve."""
+    game = Game()
+    game.add(player("left", left), player("right", right), Ball(), Court())
+    game.collision = CollisionHandler(swept=False)
+    game.set_seed(seed).set_win_score(3).set_headless()
+    game._setup()
+
+    cpus = [p if isinstance(p, CPU) else None for p in game.paddles]
+    engine = BatchEngine(1, left=cpus[0], right=cpus[1], win_score=3)
+    sync_serve(game, engine)
+    return game, engine
+
+
+def sync_serve(game, engine):
+    """Serves are random in both engines; start the batch from the game's."""
+    ball = game.ball
+    engine.x[0] = ball.x
+    engine.y[0] = ball.y
+    engine.dx[0] = ball.dx
+    engine.dy[0] = ball.dy
+
+
+def state(game, engine):
+    ball = game.ball
+    left, right = game.paddles
+    return (
+        (ball.x, ball.y, ball.dx, ball.dy, ball.speed, ball._accum,
+         left.y, right.y, game.scores["left"], game.scores["right"],
+         left.hits, right.hits, game.game_over),
+        (engine.x[0], engine.y[0], engine.dx[0], engine.dy[0], engine.speed[0],
+         engine.accum[0], engine.left_y[0], engine.right_y[0],
+         engine.scores_left[0], engine.scores_right[0],
+         engine.hits_left[0], engine.hits_right[0], engine.game_over[0]),
+    )
+
+
+# The deterministic presets never miss, so an idle paddle gives up points
+@pytest.mark.parametrize("left, right", [
+    ("hard", "predict"),
+    ("predict", "hard"),
+    ("predict", "predict"),
+    (None, "hard"),
+    ("predict", None),
+])
+@pytest.mark.parametrize("seed", [1, 7, 42])
+def test_batch_matches_scalar_engine_every_tick(left, right, seed):
+    game, engine = build(left, right, seed)
+    points = 0
+    for tick in range(2000):
+        game.step()
+        engine.step()
+
+        scored = game.scores["left"] + game.scores["right"]
+        if scored != points and not game.game_over:
+            points = scored
+            sync_serve(game, engine)
+
+        expected, actual = state(game, engine)
+        assert actual == pytest.approx(expected), f"diverged at tick {tick + 1}"
+        if game.game_over:
+            break
+
+    if None in (left, right):
+        assert game.game_over
+        assert engine.results()["winner"][0] == game.winner
+    else:
+        assert game.paddles[0].hits > 5 and game.paddles[1].hits > 5
@@ -0,0 +1,133 @@
+import pytest
+
+from pypong import Ball, Paddle
+from pypong.collision import CollisionHandler
+
+
+def court(width=400, height=22):
+    """A collision handler and a pair of centred paddles for a court size."""
+    handler = CollisionHandler()
+    handler.set_bounds(height)
+    paddles = [Paddle("left"), Paddle("right")]
+    for paddle in paddles:
+        paddle.setup(width, height)
+    return handler, paddles
+
+
+def launch(x, y, dx, dy, steps):
+    """A ball at (x, y) that has flown ``steps`` steps unobstructed."""
+    ball = Ball()
+    ball.x = x + dx * steps
+    ball.y = y + dy * steps
+    ball.dx = dx
+    ball.dy = dy
+    return ball
+
+
+def stepped(handler, y, dy, steps):
+    """Reference (y, dy) from bounce_walls after every unit step."""
+    ball = launch(0.0, y, 1.0, dy, 0)
+    for _ in range(steps):
+        ball.y += ball.dy
+        handler.bounce_walls(ball)
+    return ball.y, ball.dy
+
+
+def test_fast_ball_hits_paddle_head_on():
+    handler, (left, right) = court()
+    # 150 steps in one tick: the right face at x=397 is 97 steps away
+    ball = launch(300.0, 11.0, 1.0, 0.0, 150)
+    events = handler.sweep(ball, 300.0, 11.0, [left, right])
+
+    assert events[0] == ("hit", right)
+    assert all(kind == "wall" for kind, _ in events[1:])
+    assert ball.dx == -1.0
+    assert ball.x == pytest.approx(397.0 - 53)
+
+
+def test_fast_ball_misses_and_scores():
+    handler, (left, right) = court()
+    # Above the paddle (rows 9-13), so it passes the face and leaves the court
+    ball = launch(300.0, 3.0, 1.0, 0.0, 150)
+    events = handler.sweep(ball, 300.0, 3.0, [left, right])
+
+    assert events == [("scored", right)]
+    assert ball.x >= right.court_width
+    assert ball.dx == 1.0
+
+
+def test_fast_ball_hit_then_score_on_the_far_side():
+    handler, (left, right) = court(width=60)
+    # Hits the right paddle, then the spin sends it above the left paddle
+    ball = launch(30.0, 11.0, 1.0, 0.0, 150)
+    events = handler.sweep(ball, 30.0, 11.0, [left, right])
+
+    assert events[0] == ("hit", right)
+    assert events[-1] == ("scored", left)
+    assert ball.x < 0
+
+
+@pytest.mark.parametrize("dy", [0.9, -0.9, 0.45, -0.7])
+def test_many_wall_folds_in_one_tick(dy):
+    handler, paddles = court()
+    ball = launch(100.0, 10.0, 1.0, dy, 150)
+    events = handler.sweep(ball, 100.0, 10.0, paddles)
+
+    y, expected_dy = stepped(handler, 10.0, dy, 150)
+    assert events == [("wall", None)]
+    assert ball.y == pytest.approx(y)
+    assert ball.dy == pytest.approx(expected_dy)
+    assert ball.x == 250.0
+
+
+# Shallow balls speed up to min_dy at the wall, from the time of impact on
+@pytest.mark.parametrize("y, dy, expected", [
+    (1.05, -0.1, 1.0 + 0.3 * 0.5),
+    (19.95, 0.1, 20.0 - 0.3 * 0.5),
+    (1.2, -0.25, 1.0 + 0.3 * 0.2),
+])
+def test_shallow_ball_leaves_the_wall(y, dy, expected):
+    handler, paddles = court()
+    ball = launch(100.0, y, 1.0, dy, 1)
+    events = handler.sweep(ball, 100.0, y, paddles)
+
+    assert events == [("wall", None)]
+    assert ball.y == pytest.approx(expected)
+    # Same way out as the substep path
+    _, expected_dy = stepped(handler, y, dy, 1)
+    assert ball.dy == pytest.approx(expected_dy)
+
+
+def test_substep_paddle_ignores_ball_behind_it():
+    handler = CollisionHandler(swept=False)
+    handler.set_bounds(22)
+    paddle = Paddle("left", depth=15)
+    paddle.setup(60, 22)
+    face = paddle.x + 1
+
+    # Already past the face: no hit, no teleport back in front
+    behind = launch(6.0, 11.0, -1.0, 0.0, 1)
+    assert handler.check_paddle(behind, paddle) is False
+    assert behind.x == 5.0
+
+    crossing = launch(face + 1.0, 11.0, -1.0, 0.0, 1)
+    assert handler.check_paddle(crossing, paddle) is True
+    assert crossing.x == paddle.x + 2
+    assert crossing.dx == 1.0
+
+
+def test_ball_resting_on_a_missed_face_is_not_returned_next_tick():
+    handler, (left, right) = court(width=60)
+    face = left.x + 1
+    # Ends the tick exactly on the face, above the paddle: a miss
+    ball = launch(face + 3.0, 3.0, -1.0, 0.0, 3)
+    assert handler.sweep(ball, face + 3.0, 3.0, [left, right]) == []
+    assert ball.x == face
+
+    # The paddle moves onto the ball's row; the next step must not hit
+    left.y = 1.0
+    x0, y0 = ball.x, ball.y
+    ball.x -= 1.0
+    assert handler.sweep(ball, x0, y0, [left, right]) == []
+    assert ball.dx == -1.0
+    assert left.hits == 0
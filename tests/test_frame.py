@@ -0,0 +1,42 @@
+import pytest
+
+from pypong import Ball, CPU, Court, Game
+
+
+def playing_game():
+    game = Game()
+    game.add(CPU("left", difficulty="hard"), CPU("right", difficulty="hard"),
+             Ball(), Court(width=40, height=12))
+    game.set_seed(1)
+    for _ in range(100):
+        game.step()
+    return game
+
+
+def field(frame, court):
+    """The court rows of a frame, side borders included."""
+    lines = frame.split("\n")
+    return lines[3:3 + court.height]
+
+
+@pytest.mark.parametrize("setting, value", [
+    ("border_h", "-"),
+    ("border_v", "|"),
+    ("corner_tl", "+"),
+    ("net_char", ":"),
+    ("net_enabled", False),
+])
+def test_court_changes_redraw_the_frame(setting, value):
+    game = playing_game()
+    court = game.court
+    before = game._build_frame()
+
+    setattr(court, setting, value)
+    after = game._build_frame()
+    assert after != before
+
+    rows = field(after, court)
+    net = court.net_x() + 1
+    assert after.split("\n")[2] == court.top_border()
+    assert all(row[0] == court.border_v and row[-1] == court.border_v for row in rows)
+    assert [row[net] for row in rows[::2]] == [court.get_net_char(0)] * len(rows[::2])
@@ -0,0 +1,71 @@
+import os
+import sys
+
+import pytest
+
+from pypong.input import WINDOWS, InputHandler
+
+pytestmark = pytest.mark.skipif(WINDOWS, reason="POSIX terminal input")
+
+
+@pytest.fixture
+def terminal(monkeypatch):
+    """An InputHandler reading from a pseudo-terminal, and a way to type into it."""
+    master, slave = os.openpty()
+    stdin = os.fdopen(slave, "r")
+    monkeypatch.setattr(sys, "stdin", stdin)
+    handler = InputHandler()
+
+    def type_(data):
+        os.write(master, data)
+        assert handler.wait(1.0)
+
+    yield handler, type_
+    handler.cleanup()
+    stdin.close()
+    os.close(master)
+
+
+@pytest.mark.parametrize("text, keys", [
+    ("wWs", ["w", "w", "s"]),
+    ("\x1b[A\x1b[B\x1b[C\x1b[D", ["up", "down", "right", "left"]),
+    ("\x1bOA\x1bOH\x1b[F", ["up", "home", "end"]),
+    # Parameters before the final byte, and an unknown final byte
+    ("\x1b[1;5Ai\x1b[3~k", ["up", "i", "k"]),
+    ("\x1bq", ["esc", "q"]),
+])
+def test_parse(terminal, text, keys):
+    handler, _ = terminal
+    assert handler._parse(text) == keys
+    assert handler._pending == ""
+
+
+@pytest.mark.parametrize("text", ["\x1b", "\x1b[", "\x1b[1;5", "\x1bO"])
+def test_parse_holds_a_partial_sequence(terminal, text):
+    handler, _ = terminal
+    assert handler._parse("w" + text) == ["w"]
+    assert handler._pending == text
+
+
+def test_sequence_split_across_reads(terminal):
+    handler, type_ = terminal
+    type_(b"s\x1b[")
+    assert handler.read_keys() == ["s"]
+    type_(b"Aw")
+    assert handler.read_keys() == ["up", "w"]
+
+
+def test_lone_escape_is_the_escape_key(terminal):
+    handler, type_ = terminal
+    type_(b"\x1b")
+    assert handler.read_keys() == []
+    assert handler.read_keys() == ["esc"]
+
+
+def test_keys_past_the_limit_stay_queued(terminal):
+    handler, type_ = terminal
+    type_(b"w" * 10 + b"s" * 10)
+    assert handler.read_keys(max_keys=15) == ["w"] * 10 + ["s"] * 5
+    assert handler.wait(0)
+    assert handler.read_keys(max_keys=15) == ["s"] * 5
+    assert handler.read_keys() == []
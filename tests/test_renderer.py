@@ -0,0 +1,93 @@
+import re
+
+from pypong import Ball, CPU, Court, Game
+from pypong.renderer import Renderer
+
+CSI = re.compile(r"\033\[([0-9;]*)([A-Za-z])")
+
+
+class Screen:
+    """Just enough of a terminal to apply Renderer output."""
+
+    def __init__(self):
+        self.cells = {}
+        self.row = 0
+        self.col = 0
+
+    def feed(self, text):
+        i = 0
+        while i < len(text):
+            match = CSI.match(text, i)
+            if match:
+                args, command = match.groups()
+                i = match.end()
+                if command == "H":
+                    row, col = args.split(";") if args else (1, 1)
+                    self.row, self.col = int(row) - 1, int(col) - 1
+                elif command == "K":
+                    self._erase(lambda r, c: r == self.row and c >= self.col)
+                elif command == "J":
+                    if args == "2":
+                        self.cells = {}
+                    else:
+                        self._erase(lambda r, c: r > self.row
+                                    or (r == self.row and c >= self.col))
+                continue
+            char = text[i]
+            i += 1
+            if char == "\n":
+                self.row += 1
+                self.col = 0
+            else:
+                self.cells[self.row, self.col] = char
+                self.col += 1
+
+    def _erase(self, test):
+        self.cells = {cell: char for cell, char in self.cells.items() if not test(*cell)}
+
+    def lines(self, count):
+        out = []
+        for row in range(count):
+            cols = [c for r, c in self.cells if r == row]
+            width = max(cols) + 1 if cols else 0
+            out.append("".join(self.cells.get((row, c), " ") for c in range(width)).rstrip())
+        return out
+
+
+def check(screen, renderer, frame):
+    screen.feed(renderer.build(frame))
+    lines = frame.split("\n")
+    # Rows past the frame must be blank too
+    assert screen.lines(len(lines) + 3) == [line.rstrip() for line in lines] + [""] * 3
+
+
+def test_diffs_reproduce_every_frame_without_clearing():
+    game = Game()
+    game.add(CPU("left", difficulty="hard"), CPU("right", difficulty="easy"),
+             Ball(), Court(width=40, height=12))
+    game.set_seed(4).set_win_score(2).set_headless()
+    renderer = Renderer()
+    screen = Screen()
+
+    script = {150: ["p"], 170: ["p"], 400: ["r"]}
+    for tick in range(1500):
+        # Countdown digits, pause, game over and restart change the status line
+        game.step(script.get(tick))
+        check(screen, renderer, game.frame())
+    assert game.scores["left"] + game.scores["right"] > 0
+    assert renderer.full_redraws == 1
+
+
+def test_height_and_width_changes():
+    renderer = Renderer()
+    screen = Screen()
+    frames = [
+        "score 0\n|  o  |\n|     |\nstatus",
+        "score 0\n|     |",
+        "score 10\n|   o   |\n|       |\n|       |\n>>> PAUSED <<<",
+        "s",
+        "score 1\n|  o  |\n\nstatus line",
+    ]
+    for frame in frames:
+        check(screen, renderer, frame)
+    assert renderer.full_redraws == 1
@@ -0,0 +1,58 @@
+import io
+import random
+
+from pypong import Ball, CPU, Court, Game
+from pypong.replay import Replay, ReplayRecorder
+
+
+def build():
+    game = Game()
+    game.add(CPU("left", difficulty="medium"), CPU("right", difficulty="medium"),
+             Ball(), Court())
+    return game.set_win_score(3)
+
+
+def test_interleaved_games_replay_exactly():
+    files = [io.BytesIO(), io.BytesIO()]
+    games = [build().set_seed(seed).set_recorder(ReplayRecorder(f, snapshot_every=200))
+             for seed, f in zip((11, 12), files)]
+
+    random.seed(5)
+    expected = random.random()
+    random.seed(5)
+    while not all(game.game_over for game in games):
+        for game in games:
+            if not game.game_over:
+                game.step()
+    # Games draw from their own generators, never the random module
+    assert random.random() == expected
+
+    for game, f in zip(games, files):
+        game.recorder.end()
+        replay = Replay.read_all(f.getvalue())[0]
+
+        played = replay.play(build())
+        assert played.scores == game.scores
+        assert played.snapshot() == game.snapshot()
+
+        middle = replay.last_tick // 2
+        sought = replay.seek(build(), middle)
+        replay._advance(sought, middle, replay.last_tick)
+        assert sought.snapshot() == game.snapshot()
+
+
+def test_replay_into_a_game_without_a_court_uses_the_recorded_size():
+    out = io.BytesIO()
+    game = Game()
+    game.add(CPU("left", difficulty="medium"), CPU("right", difficulty="medium"),
+             Ball(), Court(width=80, height=30))
+    game.set_seed(3).set_win_score(2).set_recorder(ReplayRecorder(out))
+    while game.step() and not game.game_over:
+        pass
+    game.recorder.end()
+
+    bare = Game()
+    bare.add(CPU("left", difficulty="medium"), CPU("right", difficulty="medium"), Ball())
+    played = Replay.read_all(out.getvalue())[0].play(bare)
+    assert (played.court.width, played.court.height) == (80, 30)
+    assert played.snapshot() == game.snapshot()
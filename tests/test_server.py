@@ -0,0 +1,28 @@
+import asyncio
+
+from pypong.server import PongClient, PongServer
+
+
+def test_human_match_waits_for_both_players():
+    async def play():
+        server = PongServer(tick_rate=0.002, win_score=1)
+        port = await server.start()
+        try:
+            first = await PongClient.connect("127.0.0.1", port, "duel")
+            await asyncio.sleep(0.2)
+            match = server.matches["duel"]
+            assert match.game.ticks == 0
+            await first.read()
+            assert first.state["st"] == "w"
+
+            second = await PongClient.connect("127.0.0.1", port, "duel")
+            while await first.read():
+                pass
+            second.close()
+            return first.winner, match.game.scores
+        finally:
+            await server.close()
+
+    winner, scores = asyncio.run(play())
+    assert winner in ("left", "right")
+    assert scores[winner] == 1
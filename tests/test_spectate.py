@@ -0,0 +1,40 @@
+import asyncio
+import os
+
+from pypong import Ball, CPU, Court, Game
+from pypong.spectate import SpectatorHub
+
+
+class Sink:
+    def __init__(self):
+        self.data = bytearray()
+
+    def write(self, data):
+        self.data += data
+
+
+def test_hub_and_writer_share_one_frame_per_tick():
+    read_fd, write_fd = os.pipe()
+    hub = SpectatorHub()
+    hub.add(write_fd)
+
+    game = Game()
+    game.add(CPU("left", difficulty="hard"), CPU("right", difficulty="easy"),
+             Ball(), Court())
+    game.set_seed(3).set_win_score(1).set_tick_rate(0.001).set_spectators(hub)
+
+    builds = []
+    build = game._build_frame
+    game._build_frame = lambda: builds.append(1) or build()
+
+    sink = Sink()
+    try:
+        asyncio.run(game.run_async(sink, exit_on_game_over=True))
+    finally:
+        hub.close()
+        os.close(read_fd)
+
+    assert game.game_over
+    assert hub.frames == game.ticks
+    assert len(builds) == game.ticks
+    assert sink.data
@@ -0,0 +1,47 @@
+import io
+import json
+import threading
+
+from pypong import Ball, CPU, Court, Game
+from pypong.telemetry import Telemetry
+
+
+class BrokenFile:
+    def write(self, text):
+        raise OSError("disk gone")
+
+    def flush(self):
+        raise OSError("disk gone")
+
+
+def play(telemetry, win_score=3):
+    game = Game()
+    game.add(CPU("left", difficulty="hard"), CPU("right", difficulty="easy"),
+             Ball(), Court())
+    game.set_seed(2).set_win_score(win_score).set_telemetry(telemetry)
+    while game.step() and not game.game_over:
+        pass
+    return game
+
+
+def test_close_writes_the_last_batch():
+    out = io.StringIO()
+    telemetry = Telemetry(out, batch_size=10 ** 6)
+    play(telemetry)
+    telemetry.close()
+
+    batch = json.loads(out.getvalue())
+    assert batch["kind"].count("over") == 1
+    assert len(batch["tick"]) == sum(telemetry.aggregates.counts.values())
+
+
+def test_write_errors_do_not_hang_close():
+    telemetry = Telemetry(BrokenFile(), batch_size=4, max_pending=2)
+    play(telemetry, win_score=5)
+
+    closer = threading.Thread(target=telemetry.close, daemon=True)
+    closer.start()
+    closer.join(5)
+    assert not closer.is_alive()
+    assert isinstance(telemetry.error, OSError)
+    assert telemetry.aggregates.counts["over"] == 1